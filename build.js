@@ -22,6 +22,72 @@ const packageJson = JSON.parse(fs.readFileSync("package.json"));
 const getTime = () => new Date().toTimeString()
         .split(" ")[0];
 
+const entryPoints = ["./src/index.js"];
+const external = ["*.woff", "*.woff2", "*.jpg", "*.svg", "../../assets*"];
+const loader = {
+    ".js": "jsx",
+    ".py": "text",
+    ".txt": "text",
+};
+const sassOptions = {
+    loadPaths: [...nodePaths, "node_modules"],
+    quietDeps: true,
+};
+
+// The wizard pages are split into chunks loaded on demand, esbuild emits the styles
+// of each chunk into its own file which nothing loads. Bundle the styles of all
+// the pages into index.css instead, the same way as without code splitting.
+const singleStylesheetPlugin = {
+    name: "single-stylesheet",
+    setup (build) {
+        build.onEnd(async result => {
+            if (result.errors.length > 0) {
+                return;
+            }
+
+            Object.keys(result.metafile.outputs)
+                    .filter(file => file.endsWith(".css") || file.endsWith(".css.map"))
+                    .forEach(file => fs.rmSync(file, { force: true }));
+
+            const styles = await esbuild.build({
+                bundle: true,
+                entryPoints,
+                external,
+                loader,
+                minify: production,
+                nodePaths,
+                outdir,
+                plugins: [sassPlugin(sassOptions)],
+                sourcemap: "linked",
+                write: false,
+            });
+            styles.outputFiles
+                    .filter(file => file.path.endsWith(".css") || file.path.endsWith(".css.map"))
+                    .forEach(file => fs.writeFileSync(file.path, file.contents));
+        });
+    }
+};
+
+// Print the size of the entry point and of every chunk
+const chunkSizesPlugin = {
+    name: "chunk-sizes",
+    setup (build) {
+        build.onEnd(result => {
+            if (result.errors.length > 0) {
+                return;
+            }
+
+            Object.entries(result.metafile.outputs)
+                    .filter(([file]) => file.endsWith(".js"))
+                    .sort(([, a], [, b]) => b.bytes - a.bytes)
+                    .forEach(([file, output]) => {
+                        // eslint-disable-next-line no-console
+                        console.log(`${(output.bytes / 1024).toFixed(1).padStart(9)} KiB  ${file}`);
+                    });
+        });
+    }
+};
+
 // similar to fs.watch(), but recursively watches all subdirectories
 function watchDirs (dir, onChange) {
     const callback = (ev, dir, fname) => {
@@ -49,14 +115,13 @@ function watchDirs (dir, onChange) {
 
 const context = await esbuild.context({
     bundle: true,
-    entryPoints: ["./src/index.js"],
-    external: ["*.woff", "*.woff2", "*.jpg", "*.svg", "../../assets*"],
+    chunkNames: "chunk-[name]-[hash]",
+    entryPoints,
+    external,
+    format: "esm",
     legalComments: "external", // Move all legal comments to a .LEGAL.txt file
-    loader: {
-        ".js": "jsx",
-        ".py": "text",
-        ".txt": "text",
-    },
+    loader,
+    metafile: true,
     minify: production,
     nodePaths,
     outdir,
@@ -72,10 +137,9 @@ const context = await esbuild.context({
                 { from: ["./VERSION.txt"], to: ["./VERSION.txt"] },
             ]
         }),
-        sassPlugin({
-            loadPaths: [...nodePaths, "node_modules"],
-            quietDeps: true,
-        }),
+        sassPlugin(sassOptions),
+        singleStylesheetPlugin,
+        chunkSizesPlugin,
         cockpitPoEsbuildPlugin(),
         cockpitCompressPlugin(),
         cockpitRsyncEsbuildPlugin({ dest: packageJson.name }),
@@ -91,6 +155,7 @@ const context = await esbuild.context({
         },
     ],
     sourcemap: "linked",
+    splitting: true,
     target: ["es2020"],
 });
 
@@ -153,6 +153,12 @@ class MockingSystem {
             "const debug = () => {};"
         );
 
+        // Mock lazy loaded page components, their chunks are never loaded here
+        content = content.replace(
+            /import\s+\{\s*lazyComponent\s*\}\s+from\s+["'][^"']*["'];?/g,
+            "const lazyComponent = () => ({});"
+        );
+
         // Mock all JSX file imports with comprehensive function mocks
         content = content.replace(
             /import\s+\{\s*([^}]+)\s*\}\s+from\s+["'][^"']*\.jsx["'];?/g,
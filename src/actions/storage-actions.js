@@ -3,17 +3,8 @@
  * SPDX-License-Identifier: LGPL-2.1-or-later
  */
 
-import cockpit from "cockpit";
-
 import {
-    getActions,
-    getDeviceData,
-    getDevices,
-    getDiskFreeSpace,
-    getDiskTotalSpace,
-    getExistingSystems,
-    getFormatData,
-    getMountPoints,
+    getDeviceTreeSnapshot,
 } from "../apis/storage_devicetree.js";
 import {
     getAllDiskSelection,
@@ -26,46 +17,24 @@ import {
     getPartitioningMethod,
 } from "../apis/storage_partitioning.js";
 
-export const getDevicesAction = () => {
-    return async (dispatch) => {
+/**
+ * @param {boolean} incremental     Refetch only the devices changed by the scheduled actions,
+ *                                  reusing the data of the original device tree for the rest
+ */
+export const getDevicesAction = ({ incremental = false } = {}) => {
+    return async (dispatch, getState) => {
         dispatch({
             payload: { isFetching: true },
             type: "SET_IS_FETCHING",
         });
 
-        const actions = await getActions();
-        const devices = await getDevices();
-        const deviceData = {};
-        const mountPoints = await getMountPoints();
-        const existingSystems = await getExistingSystems();
-        for (const device of devices) {
-            try {
-                const devData = await getDeviceData({ disk: device });
-
-                const free = await getDiskFreeSpace({ diskNames: [device] });
-                // extend it with variants to keep the format consistent
-                devData.free = cockpit.variant(String, free);
-
-                const total = await getDiskTotalSpace({ diskNames: [device] });
-                devData.total = cockpit.variant(String, total);
-
-                const formatData = await getFormatData({ diskName: device });
-                devData.formatData = formatData;
-
-                deviceData[device] = devData;
-            } catch (error) {
-                if (error.name === "org.fedoraproject.Anaconda.Modules.Storage.UnknownDeviceError") {
-                    continue;
-                } else {
-                    throw error;
-                }
-            }
-        }
+        const base = incremental ? getState?.().storage.deviceTrees[""]?.devices : undefined;
+        const { actions, devices, existingSystems, mountPoints } = await getDeviceTreeSnapshot({ base });
 
         dispatch({
             payload: {
                 actions,
-                devices: deviceData,
+                devices,
                 existingSystems,
                 mountPoints,
             },
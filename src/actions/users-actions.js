@@ -10,7 +10,7 @@ import {
     getUsers,
 } from "../apis/users.js";
 
-import { parseAnacondaConfBool } from "../helpers/conf.js";
+import { getUserInterfaceConf } from "../helpers/conf.js";
 import { canModifyRootConfiguration, canModifyUserConfiguration } from "../helpers/users.js";
 
 export const setUsersAction = (payload) => ({
@@ -41,8 +41,7 @@ export const setUserConfigurationPolicyAction = (policy) => ({
 
 export const getUserConfigurationPolicyAction = (args = {}) => async (dispatch) => {
     const { automatedInstall, conf } = args;
-    const canChangeRoot = parseAnacondaConfBool(conf?.["User Interface"]?.can_change_root);
-    const canChangeUsers = parseAnacondaConfBool(conf?.["User Interface"]?.can_change_users);
+    const { canChangeRoot, canChangeUsers } = getUserInterfaceConf(conf);
 
     const [users, canChangeRootPassword] = await Promise.all([
         getUsers(),
@@ -5,8 +5,10 @@
 
 import cockpit from "cockpit";
 
-import { error } from "../helpers/log.js";
-import { _callClient, _getProperty } from "./helpers.js";
+import { debug, error } from "../helpers/log.js";
+import { scheduleSteps } from "../helpers/scheduler.js";
+import { endStartup, mark, measure, timeSpan } from "../helpers/timeline.js";
+import { _callClient, _getPropertyUncached, _subscribe, PropertyCache } from "./helpers.js";
 
 import { moduleClients } from "./index.js";
 
@@ -37,35 +39,69 @@ export class BossClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "boss");
         this.address = address;
         this.dispatch = dispatch;
     }
 
+    /**
+     * Initialize all module clients
+     *
+     * The initialization steps of all modules are run concurrently, each step
+     * waits only for the steps it declares in its `after` list. The step IDs, shown
+     * in the timeline and the debug output, are named `<module>-<what>`.
+     *
+     * @param {object} args     Bootstrap args from `Application` (`conf`, `automatedInstall`)
+     *
+     * @returns {Object}        The `ready` promise resolves when the data needed by the first
+     *                          screen is available, the `done` promise when all steps finished
+     */
     init (args = {}) {
         this.client.addEventListener("close", () => error("Boss client closed"));
+        mark("init-start");
 
-        return Promise.all(
-            moduleClients.map(Client => new Client(this.address, this.dispatch).init(args))
-        ).then(() => {
+        const steps = moduleClients.flatMap(Client => {
+            const client = new Client(this.address, this.dispatch);
+
+            client.init(args);
+
+            return client.initSteps(args);
+        }).map(step => ({ ...step, run: () => timeSpan(`init-step:${step.id}`, step.run) }));
+        const { promises, timings } = scheduleSteps(steps);
+
+        this.initTimings = timings;
+
+        const done = Promise.all(Object.values(promises)).then(() => {
+            measure("init", "init-start");
+            endStartup();
+            debug("Initialization steps finished", JSON.stringify(timings));
             this.startEventMonitor();
         });
+        // Automated installations start at the review screen, which needs all the data
+        const ready = (args.automatedInstall
+            ? done
+            : Promise.all(steps.filter(step => step.blocking).map(step => promises[step.id]))
+        ).then(() => measure("init-first-screen", "init-start"));
+
+        return { done, ready };
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            (path, iface, signal, args) => {
-                if (signal === "PropertiesChanged" &&
-                    args[0] === INTERFACE_NAME &&
-                    Object.hasOwn(args[1], "ActiveInstallationTask") &&
-                    args[1].ActiveInstallationTask.v) {
+        this._subscription = _subscribe(this.client, "boss", [
+            {
+                handler: (path, args) => {
+                    if (!args[1].ActiveInstallationTask.v) {
+                        return;
+                    }
                     for (const Client of moduleClients) {
                         Client.instance?.stopEventMonitor();
                     }
                     this.stopEventMonitor();
-                }
-            }
-        );
+                },
+                interface: INTERFACE_NAME,
+                properties: ["ActiveInstallationTask"],
+            },
+        ]);
     }
 
     stopEventMonitor () {
@@ -92,7 +128,7 @@ export const getSteps = ({ task }) => {
  * @returns {Promise}           Resolves the object path of the active installation task, or ""
  */
 export const getActiveInstallationTask = () => {
-    return _getProperty(BossClient, OBJECT_PATH, INTERFACE_NAME, "ActiveInstallationTask");
+    return _getPropertyUncached(BossClient, OBJECT_PATH, INTERFACE_NAME, "ActiveInstallationTask");
 };
 
 /**
@@ -4,22 +4,299 @@
  */
 import cockpit from "cockpit";
 
+import { recordCall } from "../helpers/metrics.js";
+import { timeEvent } from "../helpers/timeline.js";
+
+/* Run a DBus call, recording its latency on the timeline and in the call statistics */
+const trackCall = (method, args, call) => {
+    const start = performance.now();
+    const record = (failed) => recordCall({ args, duration: performance.now() - start, failed, method });
+
+    return timeEvent(`dbus:${method}`, call).then(
+        res => {
+            record(false);
+            return res;
+        },
+        exc => {
+            record(true);
+            throw exc;
+        }
+    );
+};
+
+/* Methods which only read data from the backend. Concurrent identical calls
+ * of these share one DBus request, calls of any other method are never merged.
+ */
+const readOnlyMethods = new Set([
+    "CalculateRequiredSpace",
+    "GetActions",
+    "GetAllValidTimezones",
+    "GetCommonLocales",
+    "GetDefaultEnvironment",
+    "GetDeviceData",
+    "GetDevices",
+    "GetDiskFreeSpace",
+    "GetDiskTotalSpace",
+    "GetEnvironmentData",
+    "GetEnvironments",
+    "GetExistingSystems",
+    "GetFormatData",
+    "GetFormatTypeData",
+    "GetFreeSpaceForSystem",
+    "GetGroupData",
+    "GetKeyboardLayouts",
+    "GetLanguageData",
+    "GetLanguages",
+    "GetLocaleData",
+    "GetLocales",
+    "GetMountPointConstraints",
+    "GetMountPoints",
+    "GetRequiredDeviceSize",
+    "GetUsableDisks",
+    "GuessUsernameFromFullName",
+    "IsDeviceShrinkable",
+    "ResolveEnvironment",
+]);
+
+/* Pending read-only calls per client instance, keyed by the call signature */
+const pendingCalls = new WeakMap();
+
 export const _callClient = (Client, OBJECT_PATH, INTERFACE_NAME, ...args) => {
-    return new Client().client.call(OBJECT_PATH, INTERFACE_NAME, ...args).then(res => res[0]);
+    const instance = new Client();
+    const call = () => trackCall(
+        `${INTERFACE_NAME}.${args[0]}`, args.slice(1),
+        () => instance.client.call(OBJECT_PATH, INTERFACE_NAME, ...args)
+    ).then(res => res[0]);
+
+    if (!readOnlyMethods.has(args[0])) {
+        return call();
+    }
+
+    if (!pendingCalls.has(instance)) {
+        pendingCalls.set(instance, new Map());
+    }
+    const pending = pendingCalls.get(instance);
+    const key = JSON.stringify([OBJECT_PATH, INTERFACE_NAME, ...args]);
+
+    if (!pending.has(key)) {
+        pending.set(key, call().finally(() => pending.delete(key)));
+    }
+
+    return pending.get(key);
+};
+
+const PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties";
+
+/**
+ * Cache of the DBus property values read through a module client
+ *
+ * Values are filled lazily on the first read and kept up to date from the
+ * PropertiesChanged signals of the interfaces read through the cache. The cache
+ * subscribes with its own signal rules, one per interface, which are never removed,
+ * so that it keeps being invalidated after the client's event monitor is stopped.
+ */
+export class PropertyCache {
+    /**
+     * @param {Object} client       A cockpit DBus client
+     * @param {string} owner        The name of the module, shown when inspecting the signal rules
+     */
+    constructor (client, owner) {
+        this.client = client;
+        this.owner = `${owner}-property-cache`;
+        this.interfaces = new Set();
+        this.values = new Map();
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    /* Subscribe to the property changes of the interface once it is read through the cache */
+    _watch (interfaceName) {
+        if (this.interfaces.has(interfaceName)) {
+            return;
+        }
+
+        this.interfaces.add(interfaceName);
+        _subscribe(this.client, this.owner, [{
+            handler: (path, [, changed, invalidated]) => {
+                for (const [name, value] of Object.entries(changed)) {
+                    this.values.set(this._key(path, interfaceName, name), Promise.resolve(value.v));
+                }
+                for (const name of invalidated) {
+                    this.invalidate(path, interfaceName, name);
+                }
+            },
+            interface: interfaceName,
+        }]);
+    }
+
+    _key (path, interfaceName, name) {
+        return `${path}\n${interfaceName}\n${name}`;
+    }
+
+    /**
+     * @param {Function} fetch      Called to read the value on a cache miss
+     *
+     * @returns {Promise}           Resolves the cached or freshly read value
+     */
+    get (path, interfaceName, name, fetch) {
+        const key = this._key(path, interfaceName, name);
+        this._watch(interfaceName);
+
+        if (this.values.has(key)) {
+            this.hits++;
+            return this.values.get(key);
+        }
+
+        this.misses++;
+        const value = fetch();
+        this.values.set(key, value);
+        // Do not keep failed reads, unless a signal replaced the value meanwhile
+        value.catch(() => {
+            if (this.values.get(key) === value) {
+                this.values.delete(key);
+            }
+        });
+
+        return value;
+    }
+
+    /**
+     * Store already known values of properties of one interface
+     * @param {Object} values       An object mapping the property names to their values
+     */
+    seed (path, interfaceName, values) {
+        this._watch(interfaceName);
+        for (const [name, value] of Object.entries(values)) {
+            this.values.set(this._key(path, interfaceName, name), Promise.resolve(value));
+        }
+    }
+
+    invalidate (path, interfaceName, name) {
+        this.values.delete(this._key(path, interfaceName, name));
+    }
+
+    flush () {
+        this.values.clear();
+    }
+
+    get stats () {
+        return { hits: this.hits, misses: this.misses, size: this.values.size };
+    }
+}
+
+/* Active signal rules of all the clients, see _subscribe */
+const signalRules = new Set();
+
+/**
+ * Subscribe a client to the signals described by a list of rules
+ *
+ * Every rule becomes a precise DBus match, so the bus only delivers the signals
+ * some rule handles. All the signal matches of the clients, including the ones of
+ * the property caches, are made here, so getSignalRules lists every active match. A rule for the PropertiesChanged member (the default) matches
+ * the property changes of `interface`, optionally only of the listed `properties`.
+ * Rules for other members match the signals emitted on `interface` directly.
+ *
+ * @param {Object} client       A cockpit DBus client
+ * @param {string} owner        The name of the subscriber, shown when inspecting the rules
+ * @param {Array} rules         Objects with the `interface`, optional `member`, `path` and
+ *                              `properties`, and the `handler` called with the object path
+ *                              and the arguments of the signal
+ *
+ * @returns {Object}            The subscription, its `remove` method removes all its rules
+ */
+export const _subscribe = (client, owner, rules) => {
+    const entries = rules.map(rule => {
+        const member = rule.member || "PropertiesChanged";
+        const match = {
+            ...(member === "PropertiesChanged"
+                ? { arg0: rule.interface, interface: PROPERTIES_INTERFACE }
+                : { interface: rule.interface }),
+            member,
+            ...(rule.path && { path: rule.path }),
+        };
+        const entry = { handled: 0, match, owner, properties: rule.properties, received: 0 };
+
+        entry.subscription = client.subscribe(match, (path, iface, signal, args) => {
+            entry.received++;
+            if (rule.properties && !rule.properties.some(name => Object.hasOwn(args[1], name))) {
+                return;
+            }
+            entry.handled++;
+            rule.handler(path, args);
+        });
+        signalRules.add(entry);
+
+        return entry;
+    });
+
+    return {
+        remove: () => entries.forEach(entry => {
+            entry.subscription.remove();
+            signalRules.delete(entry);
+        }),
+    };
+};
+
+/**
+ * @returns {Array}             All the active signal matches of the clients, with the counts of the signals
+ *                              `received` by their match and `handled` by their handler
+ */
+export const getSignalRules = () => {
+    return [...signalRules].map(({ handled, match, owner, properties, received }) => (
+        { handled, match, owner, properties, received }
+    ));
 };
 
 export const _setProperty = (Client, OBJECT_PATH, INTERFACE_NAME, ...args) => {
-    return new Client().client.call(
-        OBJECT_PATH, "org.freedesktop.DBus.Properties", "Set", [INTERFACE_NAME, ...args]
-    );
+    const instance = new Client();
+
+    return trackCall(
+        `${INTERFACE_NAME}.Set(${args[0]})`, args.slice(1),
+        () => instance.client.call(OBJECT_PATH, PROPERTIES_INTERFACE, "Set", [INTERFACE_NAME, ...args])
+    ).finally(() => instance.propertyCache?.invalidate(OBJECT_PATH, INTERFACE_NAME, args[0]));
 };
 
-export const _getProperty = (Client, OBJECT_PATH, INTERFACE_NAME, ...args) => {
-    return new Client().client.call(
-        OBJECT_PATH, "org.freedesktop.DBus.Properties", "Get", [INTERFACE_NAME, ...args]
+/**
+ * Read a property bypassing the property cache of the client
+ */
+export const _getPropertyUncached = (Client, OBJECT_PATH, INTERFACE_NAME, ...args) => {
+    return trackCall(
+        `${INTERFACE_NAME}.Get(${args[0]})`, [],
+        () => new Client().client.call(OBJECT_PATH, PROPERTIES_INTERFACE, "Get", [INTERFACE_NAME, ...args])
     ).then(res => res[0].v);
 };
 
+export const _getProperty = (Client, OBJECT_PATH, INTERFACE_NAME, ...args) => {
+    const instance = new Client();
+    const fetch = () => _getPropertyUncached(Client, OBJECT_PATH, INTERFACE_NAME, ...args);
+
+    if (!instance.propertyCache) {
+        return fetch();
+    }
+
+    return instance.propertyCache.get(OBJECT_PATH, INTERFACE_NAME, args[0], fetch);
+};
+
+/**
+ * Read all properties of an interface in one call and seed the property cache of the client
+ *
+ * @returns {Promise}           Resolves an object mapping the property names to their values
+ */
+export const _getAllProperties = (Client, OBJECT_PATH, INTERFACE_NAME) => {
+    const instance = new Client();
+
+    return trackCall(
+        `${INTERFACE_NAME}.GetAll`, [],
+        () => instance.client.call(OBJECT_PATH, PROPERTIES_INTERFACE, "GetAll", [INTERFACE_NAME])
+    ).then(res => {
+        const values = objectFromDbus(res[0]);
+
+        instance.propertyCache?.seed(OBJECT_PATH, INTERFACE_NAME, values);
+
+        return values;
+    });
+};
+
 /**
  * Convert a DBus object (a{sv}) to a plain JavaScript object by extracting .v from variant values
  * @param {Object} obj - DBus object with variant values
@@ -8,8 +8,8 @@ import cockpit from "cockpit";
 import { getKeyboardConfigurationAction, getKeyboardLayoutsAction, getLanguageAction, getLanguagesAction, setLanguageKickstartedAction } from "../actions/localization-actions.js";
 
 import { convertToCockpitLang, getLangCookie, setLangCookie } from "../helpers/language.js";
-import { debug, error } from "../helpers/log.js";
-import { _callClient, _getProperty, _setProperty } from "./helpers.js";
+import { error } from "../helpers/log.js";
+import { _callClient, _getAllProperties, _getProperty, _setProperty, _subscribe, PropertyCache } from "./helpers.js";
 
 import { setLocale } from "./boss.js";
 
@@ -25,6 +25,9 @@ const setProperty = (...args) => {
 const getProperty = (...args) => {
     return _getProperty(LocalizationClient, OBJECT_PATH, INTERFACE_NAME, ...args);
 };
+const getAllProperties = () => {
+    return _getAllProperties(LocalizationClient, OBJECT_PATH, INTERFACE_NAME);
+};
 
 export class LocalizationClient {
     constructor (address, dispatch) {
@@ -40,37 +43,55 @@ export class LocalizationClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "localization");
         this.address = address;
         this.dispatch = dispatch;
     }
 
-    async init (args = {}) {
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener("close", () => error("Localization client closed"));
 
         this.startEventMonitor();
-
-        await this.initData(args);
     }
 
-    async initData ({ automatedInstall = false } = {}) {
-        const languageKickstarted = await getLanguageKickstarted();
-        this.dispatch(setLanguageKickstartedAction({
-            languageKickstarted: Boolean(languageKickstarted)
-        }));
-
-        await this.dispatch(getLanguageAction());
-
-        // Apply runtime locale for kickstarted automated installs
-        // (LanguageSelector.componentDidMount won't run since the wizard
-        //  jumps to review, so we must set locale here)
-        if (automatedInstall && languageKickstarted) {
-            const language = await getLanguage();
-            applyKickstartLanguage(language);
-        }
-
-        await this.dispatch(getLanguagesAction());
-        await this.dispatch(getKeyboardLayoutsAction());
-        await this.dispatch(getKeyboardConfigurationAction());
+    initSteps ({ automatedInstall = false } = {}) {
+        return [
+            {
+                blocking: true,
+                id: "localization-language",
+                run: async () => {
+                    // Load all properties at once, the actions below read them from the property cache
+                    const { Language: language, LanguageKickstarted: languageKickstarted } = await getAllProperties();
+                    this.dispatch(setLanguageKickstartedAction({
+                        languageKickstarted: Boolean(languageKickstarted)
+                    }));
+
+                    await this.dispatch(getLanguageAction());
+
+                    // Apply runtime locale for kickstarted automated installs
+                    // (LanguageSelector.componentDidMount won't run since the wizard
+                    //  jumps to review, so we must set locale here)
+                    if (automatedInstall && languageKickstarted) {
+                        applyKickstartLanguage(language);
+                    }
+                },
+            },
+            {
+                blocking: true,
+                id: "localization-languages",
+                run: () => this.dispatch(getLanguagesAction()),
+            },
+            {
+                blocking: true,
+                id: "localization-keyboard-layouts",
+                run: () => this.dispatch(getKeyboardLayoutsAction()),
+            },
+            {
+                blocking: true,
+                id: "localization-keyboard-configuration",
+                run: () => this.dispatch(getKeyboardConfigurationAction()),
+            },
+        ];
     }
 
     stopEventMonitor () {
@@ -78,35 +99,30 @@ export class LocalizationClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            async (path, iface, signal, args) => {
-                switch (signal) {
-                case "CompositorSelectedLayoutChanged":
-                case "CompositorLayoutsChanged":
-                    await this.dispatch(getKeyboardConfigurationAction());
-                    break;
-                case "PropertiesChanged":
-                    if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "Language")) {
-                        await this.dispatch(getLanguageAction());
-
-                        /* FIXME: On each locale change, KeyboardLayouts must be refetched since they are localized.
-                         * Currently, a race condition in the backend) causes the Language property to update,
-                         * but the returned KeyboardLayouts still are translated with the previous locale.
-                         * Workaround this by dispatching the KeyboardLayouts action with small delay.
-                         */
-                        setTimeout(async () => {
-                            this.dispatch(getKeyboardConfigurationAction());
-                            this.dispatch(getKeyboardLayoutsAction());
-                        }, 500);
-                    } else {
-                        debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                    }
-                    break;
-                default:
-                    debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                }
-            });
+        this._subscription = _subscribe(this.client, "localization", [
+            ...["CompositorSelectedLayoutChanged", "CompositorLayoutsChanged"].map(member => ({
+                handler: () => this.dispatch(getKeyboardConfigurationAction()),
+                interface: INTERFACE_NAME,
+                member,
+            })),
+            {
+                handler: async () => {
+                    await this.dispatch(getLanguageAction());
+
+                    /* FIXME: On each locale change, KeyboardLayouts must be refetched since they are localized.
+                     * Currently, a race condition in the backend) causes the Language property to update,
+                     * but the returned KeyboardLayouts still are translated with the previous locale.
+                     * Workaround this by dispatching the KeyboardLayouts action with small delay.
+                     */
+                    setTimeout(async () => {
+                        this.dispatch(getKeyboardConfigurationAction());
+                        this.dispatch(getKeyboardLayoutsAction());
+                    }, 500);
+                },
+                interface: INTERFACE_NAME,
+                properties: ["Language"],
+            },
+        ]);
     }
 }
 
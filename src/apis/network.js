@@ -7,8 +7,8 @@ import cockpit from "cockpit";
 
 import { getConnectedAction, getHostnameAction } from "../actions/network-actions.js";
 
-import { debug, error } from "../helpers/log.js";
-import { _getProperty, _setProperty } from "./helpers.js";
+import { error } from "../helpers/log.js";
+import { _getProperty, _setProperty, _subscribe, PropertyCache } from "./helpers.js";
 
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Network";
 const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Network";
@@ -35,21 +35,28 @@ export class NetworkClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "network");
         this.address = address;
         this.dispatch = dispatch;
     }
 
-    async init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener("close", () => error("Network client closed"));
 
         this.startEventMonitor();
-
-        await this.initData();
     }
 
-    async initData () {
-        await this.dispatch(getConnectedAction());
-        await this.dispatch(getHostnameAction());
+    initSteps () {
+        return [
+            {
+                id: "network-connected",
+                run: () => this.dispatch(getConnectedAction()),
+            },
+            {
+                id: "network-hostname",
+                run: () => this.dispatch(getHostnameAction()),
+            },
+        ];
     }
 
     stopEventMonitor () {
@@ -57,24 +64,18 @@ export class NetworkClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "Connected")) {
-                        this.dispatch(getConnectedAction());
-                    } else if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "Hostname")) {
-                        this.dispatch(getHostnameAction());
-                    } else {
-                        debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                    }
-                    break;
-                default:
-                    debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                }
-            }
-        );
+        this._subscription = _subscribe(this.client, "network", [
+            {
+                handler: () => this.dispatch(getConnectedAction()),
+                interface: INTERFACE_NAME,
+                properties: ["Connected"],
+            },
+            {
+                handler: () => this.dispatch(getHostnameAction()),
+                interface: INTERFACE_NAME,
+                properties: ["Hostname"],
+            },
+        ]);
     }
 }
 
@@ -11,7 +11,7 @@ import {
     getPayloadPackagesSelectionAction,
 } from "../actions/payload-dnf-actions.js";
 
-import { _getProperty, _setProperty, objectFromDbus, objectToDbus } from "./helpers.js";
+import { _callClient, _getAllProperties, _getProperty, _setProperty, _subscribe, objectFromDbus, objectToDbus } from "./helpers.js";
 
 import { PayloadsClient } from "./payloads.js";
 
@@ -19,12 +19,7 @@ const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Payloads.Payload.DNF"
 
 const callClient = (method, args = []) => {
     const payload = PayloadDNFClient.instance.payload;
-    return new PayloadsClient().client.call(
-        payload,
-        INTERFACE_NAME,
-        method,
-        args
-    ).then(res => res[0]);
+    return _callClient(PayloadsClient, payload, INTERFACE_NAME, method, args);
 };
 
 const getProperty = (...args) => {
@@ -52,18 +47,21 @@ export class PayloadDNFClient {
         this._lastEnvironment = null;
     }
 
-    async init (args = {}) {
+    init () {
         this.startEventMonitor();
-
-        await this.initData(args);
     }
 
-    async initData ({ automatedInstall = false } = {}) {
+    async initEnvironments () {
         await this.dispatch(getPayloadEnvironmentsAction());
-        await this.dispatch(getPayloadPackagesSelectionAction());
+    }
 
-        let selection = await getPackagesSelection();
-        const packagesKickstarted = await getPackagesKickstarted();
+    async initSelection ({ automatedInstall = false } = {}) {
+        // Load all properties at once, the actions below read them from the property cache
+        const properties = await _getAllProperties(PayloadsClient, this.payload, INTERFACE_NAME);
+        const packagesKickstarted = properties.PackagesKickstarted;
+        let selection = objectFromDbus(properties.PackagesSelection);
+
+        await this.dispatch(getPayloadPackagesSelectionAction());
 
         const kickstarted = automatedInstall && packagesKickstarted;
         if (!kickstarted && !selection?.environment) {
@@ -96,23 +94,19 @@ export class PayloadDNFClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    if (path === this.payload &&
-                        args[0] === INTERFACE_NAME &&
-                        Object.hasOwn(args[1], "PackagesSelection")) {
-                        if (args[1].PackagesSelection.v.environment.v) {
-                            this._handleEnvironmentChange(args[1].PackagesSelection.v.environment.v);
-                        }
-                        this.dispatch(getPayloadPackagesSelectionAction());
+        this._subscription = _subscribe(this.client, "payload-dnf", [
+            {
+                handler: (path, args) => {
+                    if (args[1].PackagesSelection.v.environment.v) {
+                        this._handleEnvironmentChange(args[1].PackagesSelection.v.environment.v);
                     }
-                    break;
-                }
-            }
-        );
+                    this.dispatch(getPayloadPackagesSelectionAction());
+                },
+                interface: INTERFACE_NAME,
+                path: this.payload,
+                properties: ["PackagesSelection"],
+            },
+        ]);
     }
 }
 
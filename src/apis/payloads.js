@@ -7,7 +7,7 @@ import cockpit from "cockpit";
 import { setPayloadTypeAction } from "../actions/payload.js";
 
 import { error } from "../helpers/log.js";
-import { _callClient, _getProperty } from "./helpers.js";
+import { _callClient, _getProperty, PropertyCache } from "./helpers.js";
 
 import { PayloadDNFClient } from "./payload_dnf.js";
 
@@ -38,39 +38,51 @@ export class PayloadsClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "payloads");
         this.address = address;
         this.dispatch = dispatch;
     }
 
-    init (args = {}) {
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener(
             "close", () => error("Payloads client closed")
         );
-
-        this.initData(args);
     }
 
     stopEventMonitor () {
         PayloadDNFClient.instance?.stopEventMonitor();
     }
 
-    async initData (args = {}) {
-        const activePayload = await getActivePayload();
-
-        const payloadType = await getPayloadType(activePayload);
-        this.dispatch(setPayloadTypeAction(payloadType));
-
-        // Check payload type and initialize DNF client if needed
-        await this.initPayloadClient(activePayload, args);
-    }
-
-    async initPayloadClient (payload, args = {}) {
-        // Initialize DNF client if payload type is DNF
-        const payloadType = await getPayloadType(payload);
-        if (payloadType === "DNF") {
-            const dnfClient = new PayloadDNFClient(this.client, this.dispatch, payload);
-            await dnfClient.init(args);
-        }
+    initSteps (args = {}) {
+        return [
+            {
+                // The payload type decides which screens are shown
+                blocking: true,
+                id: "payloads-active-payload",
+                run: async () => {
+                    const activePayload = await getActivePayload();
+
+                    const payloadType = await getPayloadType(activePayload);
+                    this.dispatch(setPayloadTypeAction(payloadType));
+
+                    // Initialize DNF client if payload type is DNF
+                    if (payloadType === "DNF") {
+                        this.dnfClient = new PayloadDNFClient(this.client, this.dispatch, activePayload);
+                        this.dnfClient.init();
+                    }
+                },
+            },
+            {
+                after: ["payloads-active-payload"],
+                id: "payloads-dnf-environments",
+                run: () => this.dnfClient?.initEnvironments(),
+            },
+            {
+                after: ["payloads-active-payload"],
+                id: "payloads-dnf-selection",
+                run: () => this.dnfClient?.initSelection(args),
+            },
+        ];
     }
 }
 
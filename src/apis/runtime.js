@@ -7,8 +7,8 @@ import cockpit from "cockpit";
 
 import { getPasswordPoliciesAction } from "../actions/runtime-actions.js";
 
-import { debug, error } from "../helpers/log.js";
-import { _callClient, _getProperty, _setProperty } from "./helpers.js";
+import { error } from "../helpers/log.js";
+import { _callClient, _getProperty, _setProperty, _subscribe, PropertyCache } from "./helpers.js";
 
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Runtime/UserInterface";
 const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Runtime.UserInterface";
@@ -34,18 +34,17 @@ export class RuntimeClient {
             "org.fedoraproject.Anaconda.Modules.Runtime",
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "runtime");
         this.address = address;
         this.dispatch = dispatch;
     }
 
-    async init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener(
             "close", () => error("Runtime client closed")
         );
 
         this.startEventMonitor();
-
-        await this.initData();
     }
 
     stopEventMonitor () {
@@ -53,26 +52,22 @@ export class RuntimeClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "PasswordPolicies")) {
-                        this.dispatch(getPasswordPoliciesAction());
-                    } else {
-                        debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                    }
-                    break;
-                default:
-                    debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                }
-            }
-        );
+        this._subscription = _subscribe(this.client, "runtime", [
+            {
+                handler: () => this.dispatch(getPasswordPoliciesAction()),
+                interface: INTERFACE_NAME,
+                properties: ["PasswordPolicies"],
+            },
+        ]);
     }
 
-    async initData () {
-        await this.dispatch(getPasswordPoliciesAction());
+    initSteps () {
+        return [
+            {
+                id: "runtime-password-policies",
+                run: () => this.dispatch(getPasswordPoliciesAction()),
+            },
+        ];
     }
 }
 
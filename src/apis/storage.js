@@ -12,8 +12,9 @@ import {
     setStorageScenarioAction,
 } from "../actions/storage-actions.js";
 
-import { debug, error } from "../helpers/log.js";
-import { _callClient, _getProperty } from "./helpers.js";
+import { error } from "../helpers/log.js";
+import { createRefetchQueue } from "../helpers/refetch.js";
+import { _callClient, _getAllProperties, _subscribe, PropertyCache } from "./helpers.js";
 
 const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Storage";
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Storage";
@@ -21,8 +22,8 @@ const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Storage";
 const callClient = (...args) => {
     return _callClient(StorageClient, OBJECT_PATH, INTERFACE_NAME, ...args);
 };
-const getProperty = (...args) => {
-    return _getProperty(StorageClient, OBJECT_PATH, INTERFACE_NAME, ...args);
+const getAllProperties = () => {
+    return _getAllProperties(StorageClient, OBJECT_PATH, INTERFACE_NAME);
 };
 
 export class StorageClient {
@@ -39,67 +40,115 @@ export class StorageClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "storage");
         this.address = address;
         this.dispatch = dispatch;
+        // Storage operations emit storms of PropertiesChanged signals, refetch each slice once per burst
+        this.refetchQueue = createRefetchQueue();
     }
 
-    async init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener("close", () => error("Storage client closed"));
 
         this.startEventMonitor();
-
-        await this.initData();
     }
 
     stopEventMonitor () {
         this._subscription?.remove();
+        this.refetchQueue.cancel();
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    if (args[0] === "org.fedoraproject.Anaconda.Modules.Storage.DiskSelection") {
-                        this.dispatch(getDiskSelectionAction());
-                    } else if (args[0] === "org.fedoraproject.Anaconda.Modules.Storage.Partitioning.Manual" && Object.hasOwn(args[1], "Requests")) {
-                        this.dispatch(getPartitioningDataAction({ partitioning: path, requests: args[1].Requests.v }));
-                    } else if (args[0] === "org.fedoraproject.Anaconda.Modules.Storage.Partitioning.Automatic" && Object.hasOwn(args[1], "Request")) {
-                        this.dispatch(getPartitioningDataAction({ partitioning: path, requests: [args[1].Request.v] }));
-                    } else if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "CreatedPartitioning")) {
-                        const last = args[1].CreatedPartitioning.v.length - 1;
-                        this.dispatch(getPartitioningDataAction({ partitioning: args[1].CreatedPartitioning.v[last] }));
-                    } else if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "AppliedPartitioning")) {
-                        // First set the partitioning data and then get the device information
-                        // as we store this in the store according the the deviceTree
-                        this.dispatch(setAppliedPartitioningAction({ appliedPartitioning: args[1].AppliedPartitioning.v }));
-                        this.dispatch(getDevicesAction());
-                    } else {
-                        debug(`Unhandled signal on ${path}: ${iface}.${signal} ${JSON.stringify(args)}`);
-                    }
-                    break;
-                default:
-                    debug(`Unhandled signal on ${path}: ${iface}.${signal} ${JSON.stringify(args)}`);
-                }
-            });
+        this._subscription = _subscribe(this.client, "storage", [
+            {
+                handler: () => this.refetchQueue.markDirty("disk-selection", () => this.dispatch(getDiskSelectionAction())),
+                interface: "org.fedoraproject.Anaconda.Modules.Storage.DiskSelection",
+            },
+            {
+                handler: (path, args) => {
+                    const requests = args[1].Requests.v;
+                    this.refetchQueue.markDirty(
+                        `partitioning-requests:${path}`,
+                        () => this.dispatch(getPartitioningDataAction({ partitioning: path, requests }))
+                    );
+                },
+                interface: "org.fedoraproject.Anaconda.Modules.Storage.Partitioning.Manual",
+                properties: ["Requests"],
+            },
+            {
+                handler: (path, args) => {
+                    const requests = [args[1].Request.v];
+                    this.refetchQueue.markDirty(
+                        `partitioning-requests:${path}`,
+                        () => this.dispatch(getPartitioningDataAction({ partitioning: path, requests }))
+                    );
+                },
+                interface: "org.fedoraproject.Anaconda.Modules.Storage.Partitioning.Automatic",
+                properties: ["Request"],
+            },
+            {
+                handler: (path, args) => {
+                    const last = args[1].CreatedPartitioning.v.length - 1;
+                    const partitioning = args[1].CreatedPartitioning.v[last];
+                    this.refetchQueue.markDirty(
+                        "created-partitioning",
+                        () => this.dispatch(getPartitioningDataAction({ partitioning }))
+                    );
+                },
+                interface: INTERFACE_NAME,
+                path: OBJECT_PATH,
+                properties: ["CreatedPartitioning"],
+            },
+            {
+                handler: (path, args) => {
+                    // First set the partitioning data and then get the device information
+                    // as we store this in the store according the the deviceTree
+                    // Applying a partitioning only changes the devices touched by its actions,
+                    // resetting it goes back to the original device tree which is fetched fully
+                    const appliedPartitioning = args[1].AppliedPartitioning.v;
+                    this.dispatch(setAppliedPartitioningAction({ appliedPartitioning }));
+                    this.refetchQueue.markDirty(
+                        "devices",
+                        () => this.dispatch(getDevicesAction({ incremental: !!appliedPartitioning }))
+                    );
+                },
+                interface: INTERFACE_NAME,
+                path: OBJECT_PATH,
+                properties: ["AppliedPartitioning"],
+            },
+        ]);
     }
 
-    async initData () {
-        const partitioning = await getProperty("CreatedPartitioning");
-
-        // When there is just one partitioning created when the module is initialized we can assume
-        // that it is the one specified in kickstart
-        if (partitioning.length === 1) {
-            this.dispatch(setStorageScenarioAction("use-configured-storage-kickstart"));
-        }
+    initSteps () {
+        return [
+            {
+                // The storage scenario decides which screens are shown
+                blocking: true,
+                id: "storage-partitioning",
+                run: async () => {
+                    const { CreatedPartitioning: partitioning } = await getAllProperties();
+
+                    // When there is just one partitioning created when the module is initialized we can assume
+                    // that it is the one specified in kickstart
+                    if (partitioning.length === 1) {
+                        this.dispatch(setStorageScenarioAction("use-configured-storage-kickstart"));
+                    }
 
-        if (partitioning.length !== 0) {
-            const lastPartitioning = partitioning[partitioning.length - 1];
-            await this.dispatch(getPartitioningDataAction({ partitioning: lastPartitioning }));
-        }
-        await this.dispatch(getDevicesAction());
-        await this.dispatch(getDiskSelectionAction());
+                    if (partitioning.length !== 0) {
+                        const lastPartitioning = partitioning[partitioning.length - 1];
+                        await this.dispatch(getPartitioningDataAction({ partitioning: lastPartitioning }));
+                    }
+                },
+            },
+            {
+                id: "storage-devices",
+                run: () => this.dispatch(getDevicesAction()),
+            },
+            {
+                id: "storage-disk-selection",
+                run: () => this.dispatch(getDiskSelectionAction()),
+            },
+        ];
     }
 }
 
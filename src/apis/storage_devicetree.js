@@ -2,6 +2,10 @@
  * Copyright (C) 2023 Red Hat, Inc.
  * SPDX-License-Identifier: LGPL-2.1-or-later
  */
+import cockpit from "cockpit";
+
+import { getDeviceAncestors } from "../helpers/storage.js";
+import { mapWithConcurrency } from "../helpers/utils.js";
 import { _callClient } from "./helpers.js";
 
 import {
@@ -14,6 +18,9 @@ const INTERFACE_NAME_HANDLER = "org.fedoraproject.Anaconda.Modules.Storage.Devic
 const INTERFACE_NAME_RESIZABLE = "org.fedoraproject.Anaconda.Modules.Storage.DeviceTree.Resizable";
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Storage/DeviceTree";
 
+/* Maximal number of devices fetched at the same time when taking a device tree snapshot */
+const SNAPSHOT_CONCURRENCY = 16;
+
 export class DeviceTree {
     constructor (deviceTree = OBJECT_PATH) {
         this.deviceTree = deviceTree;
@@ -140,6 +147,153 @@ export const getMountPoints = () => {
     return new DeviceTree().callViewer("GetMountPoints", []);
 };
 
+/**
+ * @param {DeviceTree} deviceTree   A device tree
+ * @param {string} device           A device ID
+ *
+ * @returns {Promise}               Resolves the device data extended with the free space,
+ *                                  total space and format data, or undefined if the device
+ *                                  is no longer known to the device tree
+ */
+const getDeviceRecord = async (deviceTree, device) => {
+    try {
+        const [devData, free, formatData] = await Promise.all([
+            deviceTree.callViewer("GetDeviceData", [device]),
+            deviceTree.callViewer("GetDiskFreeSpace", [[device]]),
+            deviceTree.callViewer("GetFormatData", [device]),
+        ]);
+        // The total space of a device is its size, the free space depends on the backend's
+        // view of the partition table and file systems, so it is still queried
+        const total = devData.size.v;
+
+        // Results of read-only calls can be shared with concurrent callers, do not modify them
+        return {
+            ...devData,
+            formatData,
+            // extend it with variants to keep the format consistent
+            free: cockpit.variant(String, free),
+            total: cockpit.variant(String, total),
+        };
+    } catch (error) {
+        if (error.name === "org.fedoraproject.Anaconda.Modules.Storage.UnknownDeviceError") {
+            return undefined;
+        }
+        throw error;
+    }
+};
+
+/**
+ * @param {DeviceTree} deviceTree   A device tree
+ * @param {Array[string]} devices   A list of device IDs
+ *
+ * @returns {Promise}               Resolves an object mapping the device IDs to their data,
+ *                                  devices unknown to the device tree are left out
+ */
+const getDevicesData = async (deviceTree, devices) => {
+    const records = await mapWithConcurrency(
+        devices,
+        SNAPSHOT_CONCURRENCY,
+        device => getDeviceRecord(deviceTree, device)
+    );
+
+    const deviceData = {};
+    devices.forEach((device, index) => {
+        if (records[index] !== undefined) {
+            deviceData[device] = records[index];
+        }
+    });
+
+    return deviceData;
+};
+
+/**
+ * Refetch only the devices which differ from the base device data
+ *
+ * The actions scheduled in the device tree are relative to the base device data,
+ * so only the devices they touch, their ancestors and the newly created devices
+ * need to be fetched again. Data of the other devices is reused from the base.
+ *
+ * @param {DeviceTree} deviceTree   A device tree
+ * @param {Array[string]} devices   A list of device IDs in the device tree
+ * @param {Array} actions           A list of actions scheduled in the device tree
+ * @param {Object} base             The device data the actions are relative to
+ *
+ * @returns {Promise}               Resolves an object mapping the device IDs to their data,
+ *                                  or null if the changes can not be derived from the actions
+ */
+const getChangedDevicesData = async (deviceTree, devices, actions, base) => {
+    if (Object.keys(base).length === 0) {
+        return null;
+    }
+
+    const present = new Set(devices);
+    const changed = new Set(devices.filter(device => !base[device]));
+
+    for (const action of actions) {
+        const device = action["device-id"]?.v;
+
+        if (!device) {
+            return null;
+        }
+
+        changed.add(device);
+        getDeviceAncestors(base, device).forEach(ancestor => changed.add(ancestor));
+    }
+
+    const fetched = await getDevicesData(deviceTree, [...changed].filter(device => present.has(device)));
+
+    // The parents of newly created devices are not known from the base device data,
+    // merge the device data once, the device graph is cached per device data object
+    const merged = { ...base, ...fetched };
+    const missing = Object.keys(fetched)
+            .flatMap(device => getDeviceAncestors(merged, device))
+            .filter(ancestor => present.has(ancestor) && !changed.has(ancestor));
+    missing.forEach(device => changed.add(device));
+    Object.assign(fetched, await getDevicesData(deviceTree, [...new Set(missing)]));
+
+    const deviceData = {};
+    devices.forEach(device => {
+        const data = changed.has(device) ? fetched[device] : base[device];
+
+        if (data !== undefined) {
+            deviceData[device] = data;
+        }
+    });
+
+    return deviceData;
+};
+
+/**
+ * Fetch all the data of a device tree in one batch
+ *
+ * The per-device calls are issued concurrently (bounded by SNAPSHOT_CONCURRENCY),
+ * so that they are pipelined over the bus connection instead of waiting for each
+ * other.
+ *
+ * @param {Object} base         Optional device data the actions of the device tree are
+ *                              relative to, only the changed devices are fetched then
+ * @param {string} deviceTree   DBus path to a device tree
+ *
+ * @returns {Promise}           Resolves an object with the actions, device data,
+ *                              existing systems and mount points of the device tree
+ */
+export const getDeviceTreeSnapshot = async ({ base, deviceTree = OBJECT_PATH } = {}) => {
+    const tree = new DeviceTree(deviceTree);
+    const [actions, devices, mountPoints, existingSystems] = await Promise.all([
+        tree.callViewer("GetActions", []),
+        tree.callViewer("GetDevices", []),
+        tree.callViewer("GetMountPoints", []),
+        tree.callViewer("GetExistingSystems", []),
+    ]);
+
+    let deviceData = base ? await getChangedDevicesData(tree, devices, actions, base) : null;
+    if (deviceData === null) {
+        deviceData = await getDevicesData(tree, devices);
+    }
+
+    return { actions, devices: deviceData, existingSystems, mountPoints };
+};
+
 export const findExistingSystems = async ({ onFail, onSuccess }) => {
     const tasks = await new StorageClient().client.call(
         OBJECT_PATH,
@@ -11,7 +11,7 @@ import {
 } from "../actions/timezone-actions.js";
 
 import { error } from "../helpers/log.js";
-import { _callClient, _getProperty, _setProperty } from "./helpers.js";
+import { _callClient, _getAllProperties, _getProperty, _getPropertyUncached, _setProperty, _subscribe, PropertyCache } from "./helpers.js";
 
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Timezone";
 const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Timezone";
@@ -43,23 +43,38 @@ export class TimezoneClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "timezone");
         this.address = address;
         this.dispatch = dispatch;
     }
 
-    async init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
+    init (args = {}) { // eslint-disable-line no-unused-vars -- optional bootstrap args from Application
         this.client.addEventListener("close", () => error("Timezone client closed"));
         // You can subscribe to DBus signals here if needed.
 
         this.startEventMonitor();
+    }
 
-        const [timezone, allValidTimezones, kickstarted] = await Promise.all([
-            getTimezone(),
-            getAllValidTimezones(),
-            getKickstarted(),
-        ]);
-        this.dispatch(setTimezoneAction({ kickstarted: Boolean(kickstarted), timezone }));
-        this.dispatch(setAllValidTimezonesAction({ allValidTimezones }));
+    initSteps () {
+        return [
+            {
+                id: "timezone-timezone",
+                run: async () => {
+                    const [{ Timezone: timezone }, { Kickstarted: kickstarted }] = await Promise.all([
+                        _getAllProperties(TimezoneClient, OBJECT_PATH, INTERFACE_NAME),
+                        _getAllProperties(TimezoneClient, OBJECT_PATH, KICKSTART_MODULE_INTERFACE),
+                    ]);
+                    this.dispatch(setTimezoneAction({ kickstarted: Boolean(kickstarted), timezone }));
+                },
+            },
+            {
+                id: "timezone-all-valid-timezones",
+                run: async () => {
+                    const allValidTimezones = await getAllValidTimezones();
+                    this.dispatch(setAllValidTimezonesAction({ allValidTimezones }));
+                },
+            },
+        ];
     }
 
     stopEventMonitor () {
@@ -67,18 +82,13 @@ export class TimezoneClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            async (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    if (args[0] === INTERFACE_NAME && Object.hasOwn(args[1], "Timezone")) {
-                        this.dispatch(setTimezoneAction({ timezone: args[1].Timezone.v }));
-                    }
-                    break;
-                }
-            }
-        );
+        this._subscription = _subscribe(this.client, "timezone", [
+            {
+                handler: (path, args) => this.dispatch(setTimezoneAction({ timezone: args[1].Timezone.v })),
+                interface: INTERFACE_NAME,
+                properties: ["Timezone"],
+            },
+        ]);
     }
 }
 
@@ -222,7 +232,7 @@ export const startGeolocationWithTask = () => {
  * @returns {Promise<Object>} Resolves with geolocation result data.
  */
 export const getGeolocationResult = () => {
-    return getProperty("GeolocationResult");
+    return _getPropertyUncached(TimezoneClient, OBJECT_PATH, INTERFACE_NAME, "GeolocationResult");
 };
 
 /**
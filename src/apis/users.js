@@ -6,8 +6,8 @@ import cockpit from "cockpit";
 
 import { getUserConfigurationPolicyAction, getUsersAction } from "../actions/users-actions.js";
 
-import { debug, error } from "../helpers/log.js";
-import { _callClient, _getProperty, _setProperty, objectFromDbus } from "./helpers.js";
+import { error } from "../helpers/log.js";
+import { _callClient, _getProperty, _getPropertyUncached, _setProperty, _subscribe, objectFromDbus, PropertyCache } from "./helpers.js";
 
 const OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Users";
 const INTERFACE_NAME = "org.fedoraproject.Anaconda.Modules.Users";
@@ -38,6 +38,7 @@ export class UsersClient {
             INTERFACE_NAME,
             { address, bus: "none", superuser: "try" }
         );
+        this.propertyCache = new PropertyCache(this.client, "users");
         this.address = address;
         this.dispatch = dispatch;
     }
@@ -50,10 +51,19 @@ export class UsersClient {
             "close", () => error("Users client closed")
         );
         this.startEventMonitor(args);
-        return Promise.all([
-            this.dispatch(getUsersAction()),
-            this.dispatch(getUserConfigurationPolicyAction(args)),
-        ]);
+    }
+
+    initSteps (args = {}) {
+        return [
+            {
+                id: "users-users",
+                run: () => this.dispatch(getUsersAction()),
+            },
+            {
+                id: "users-configuration-policy",
+                run: () => this.dispatch(getUserConfigurationPolicyAction(args)),
+            },
+        ];
     }
 
     stopEventMonitor () {
@@ -61,18 +71,12 @@ export class UsersClient {
     }
 
     startEventMonitor () {
-        this._subscription = this.client.subscribe(
-            { },
-            async (path, iface, signal, args) => {
-                switch (signal) {
-                case "PropertiesChanged":
-                    await this.dispatch(getUsersAction());
-                    break;
-                default:
-                    debug(`Unhandled signal on ${path}: ${iface}.${signal}`, JSON.stringify(args));
-                }
-            }
-        );
+        this._subscription = _subscribe(this.client, "users", [
+            {
+                handler: () => this.dispatch(getUsersAction()),
+                interface: INTERFACE_NAME,
+            },
+        ]);
     }
 }
 
@@ -114,7 +118,8 @@ export const getIsRootAccountLocked = () => {
 };
 
 export const getIsRootPasswordSet = () => {
-    return getProperty("IsRootPasswordSet");
+    // Changed by the root password methods, always read the current value
+    return _getPropertyUncached(UsersClient, OBJECT_PATH, INTERFACE_NAME, "IsRootPasswordSet");
 };
 
 export const getCanChangeRootPassword = () => {
@@ -6,19 +6,24 @@ import cockpit from "cockpit";
 
 import { usePageLocation } from "hooks";
 
-import React, { useContext, useEffect, useRef, useState } from "react";
+import React, { Suspense, useContext, useEffect, useRef, useState } from "react";
 import { PageSection, PageSectionTypes } from "@patternfly/react-core/dist/esm/components/Page/index.js";
 import { Wizard, WizardStep } from "@patternfly/react-core/dist/esm/components/Wizard/index.js";
 
 import { getActiveInstallationTask } from "../apis/boss.js";
 
+import { preloadWhenIdle } from "../helpers/chunks.js";
+import { markOnce, measure } from "../helpers/timeline.js";
+
 import { PageContext, PayloadContext, StorageContext, SystemTypeContext, UserInterfaceContext } from "../contexts/Common.jsx";
 
+import { EmptyStatePanel } from "cockpit-components-empty-state.jsx";
+
 import { AnacondaPage } from "./AnacondaPage.jsx";
 import { AnacondaWizardFooter } from "./AnacondaWizardFooter.jsx";
 import { getSteps } from "./steps.js";
 
-export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isFetching, onCritFail, pauseAtSummary, setCurrentStepId, showStorage }) => {
+export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isDataLoaded, isFetching, onCritFail, pauseAtSummary, setCurrentStepId, showStorage }) => {
     /**
      * Wizard step page state (reset in `AnacondaWizard` `goToStep` on step change).
      * - **isFormValid** / **setIsFormValid** — Required fields satisfied; reset when the step changes in the wizard.
@@ -67,6 +72,17 @@ export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isFe
         }
     }, [currentStepId, firstStepId, path, setCurrentStepId]);
 
+    useEffect(() => {
+        if (currentStepId && markOnce("first-step")) {
+            measure("boot-to-interactive", "page-load", "first-step");
+        }
+    }, [currentStepId]);
+
+    // The pages are loaded on demand, fetch the one the user most likely visits next meanwhile
+    const visibleSteps = stepsOrder.flatMap(s => s.steps || [s]).filter(s => !s.isHidden);
+    const nextStepComponent = visibleSteps[visibleSteps.findIndex(s => s.id === currentStepId) + 1]?.component;
+    useEffect(() => preloadWhenIdle(nextStepComponent), [nextStepComponent]);
+
     const finalStepId = stepsOrder[stepsOrder.length - 1]?.id;
     useEffect(() => {
         getActiveInstallationTask()
@@ -90,7 +106,13 @@ export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isFe
                 stepNavItemProps: { id: s.id },
                 ...(s.steps?.length && { isExpandable: true }),
             };
-            if (s.component) {
+            if (s.component && !s.isFirstScreen && !isDataLoaded) {
+                // Only the first screen is rendered before the remaining data, like the disks, is loaded
+                stepProps = {
+                    children: <EmptyStatePanel loading />,
+                    ...stepProps
+                };
+            } else if (s.component) {
                 stepProps = {
                     children: (
                         <AnacondaPage
@@ -99,7 +121,9 @@ export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isFe
                           isFirstScreen={s.isFirstScreen}
                           showStorage={showStorage}
                           usePageInit={s.usePageInit}>
-                            <s.component {...componentProps} isFirstScreen={s.isFirstScreen} />
+                            <Suspense fallback={<EmptyStatePanel loading />}>
+                                <s.component {...componentProps} isFirstScreen={s.isFirstScreen} />
+                            </Suspense>
                         </AnacondaPage>
                     ),
                     ...stepProps
@@ -135,7 +159,9 @@ export const AnacondaWizard = ({ automatedInstall, currentStepId, dispatch, isFe
     if (path[0] === finalStep.id) {
         return (
             <PageSection hasBodyWrapper={false} type={PageSectionTypes.wizard}>
-                <finalStep.component {...componentProps} />
+                <Suspense fallback={<EmptyStatePanel loading />}>
+                    <finalStep.component {...componentProps} />
+                </Suspense>
             </PageSection>
         );
     }
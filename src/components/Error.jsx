@@ -28,6 +28,8 @@ import { ExternalLinkAltIcon } from "@patternfly/react-icons/dist/esm/icons/exte
 import { EyeIcon } from "@patternfly/react-icons/dist/esm/icons/eye-icon";
 import { EyeSlashIcon } from "@patternfly/react-icons/dist/esm/icons/eye-slash-icon";
 
+import { getSignalRules } from "../apis/helpers.js";
+
 import {
     BUGZILLA_BASE_URL,
     buildBugDescription,
@@ -37,6 +39,7 @@ import {
 import { exitGui } from "../helpers/exit.js";
 import { convertToExtlinkIfNeeded } from "../helpers/extlink.js";
 import { debug, error } from "../helpers/log.js";
+import { DBUS_STATS_FILE, exportCallStats } from "../helpers/metrics.js";
 
 import { AppVersionContext, NetworkContext, OsReleaseContext, SystemTypeContext } from "../contexts/Common.jsx";
 
@@ -63,7 +66,8 @@ const LOG_FILES = [
     STORAGE_LOG,
     PROGRAM_LOG,
     PACKAGING_LOG,
-    WEBUI_LOG
+    WEBUI_LOG,
+    DBUS_STATS_FILE,
 ];
 
 const ensureMaximumReportURLLength = (reportURL) => {
@@ -438,6 +442,9 @@ const BZExceptionReportFlow = ({
                     cockpit.file(JOURNAL_LOG)
                             .replace(output)
                 ));
+        // Snapshot of the DBus call latencies and signal counts, to see which backend calls were slow
+        exportCallStats({ signalRules: getSignalRules() })
+                .catch(exc => error("Failed to write the DBus call statistics:", exc.message));
     }, []);
 
     // Pre-fill bugSummary when exception changes
@@ -9,13 +9,17 @@ import { AboutModal } from "@patternfly/react-core/dist/esm/components/AboutModa
 import { Button } from "@patternfly/react-core/dist/esm/components/Button/index.js";
 import { DescriptionList, DescriptionListDescription, DescriptionListTerm } from "@patternfly/react-core/dist/esm/components/DescriptionList/index.js";
 import { Dropdown, DropdownItem, DropdownList } from "@patternfly/react-core/dist/esm/components/Dropdown/index.js";
+import { HelperText, HelperTextItem } from "@patternfly/react-core/dist/esm/components/HelperText/index.js";
 import { MenuToggle } from "@patternfly/react-core/dist/esm/components/MenuToggle/index.js";
+import { Modal, ModalBody, ModalFooter, ModalHeader, ModalVariant } from "@patternfly/react-core/dist/esm/components/Modal/index.js";
 import { Flex } from "@patternfly/react-core/dist/esm/layouts/Flex/index.js";
 import { Stack, StackItem } from "@patternfly/react-core/dist/esm/layouts/Stack/index.js";
 import { EllipsisVIcon } from "@patternfly/react-icons/dist/esm/icons/ellipsis-v-icon";
 import { ExternalLinkAltIcon } from "@patternfly/react-icons/dist/esm/icons/external-link-alt-icon";
+import { Table, Tbody, Td, Th, Thead, Tr } from "@patternfly/react-table/dist/esm/index.js";
 
 import { convertToExtlinkIfNeeded } from "../helpers/extlink.js";
+import { exportTimeline, getTimeline } from "../helpers/timeline.js";
 
 import { AppVersionContext, OsReleaseContext, SystemTypeContext } from "../contexts/Common.jsx";
 
@@ -82,11 +86,77 @@ const AnacondaAboutModal = ({ isModalOpen, setIsAboutModalOpen }) => {
     );
 };
 
+const formatMilliseconds = (value) => cockpit.format(_("$0 ms"), Math.round(value));
+
+const StartupTimelineModal = ({ setIsTimelineOpen }) => {
+    const [exportResult, setExportResult] = useState();
+    const timeline = getTimeline();
+    // DBus calls and dispatches are too many to list, they are only part of the export
+    const entries = timeline.filter(entry => !entry.name.startsWith("dbus:") && !entry.name.startsWith("dispatch:"));
+    const dbusCallsCount = timeline.filter(entry => entry.name.startsWith("dbus:")).length;
+
+    const onExport = () => {
+        exportTimeline().then(
+            path => setExportResult({ message: cockpit.format(_("Timeline saved to $0"), path), variant: "success" }),
+            exc => setExportResult({ message: exc.message, variant: "error" })
+        );
+    };
+
+    return (
+        <Modal
+          id="startup-timeline-modal"
+          isOpen
+          onClose={() => setIsTimelineOpen(false)}
+          variant={ModalVariant.medium}
+        >
+            <ModalHeader title={_("Startup timeline")} />
+            <ModalBody>
+                <Table aria-label={_("Startup timeline")} variant="compact">
+                    <Thead>
+                        <Tr>
+                            <Th>{_("Name")}</Th>
+                            <Th>{_("Start")}</Th>
+                            <Th>{_("Duration")}</Th>
+                        </Tr>
+                    </Thead>
+                    <Tbody>
+                        {entries.map((entry, index) => (
+                            <Tr key={index}>
+                                <Td>{entry.name}</Td>
+                                <Td>{formatMilliseconds(entry.start)}</Td>
+                                <Td>{entry.type === "measure" ? formatMilliseconds(entry.duration) : ""}</Td>
+                            </Tr>
+                        ))}
+                    </Tbody>
+                </Table>
+                <HelperText>
+                    <HelperTextItem>
+                        {cockpit.format(_("$0 DBus calls are included in the exported timeline."), dbusCallsCount)}
+                    </HelperTextItem>
+                    {exportResult &&
+                    <HelperTextItem id="startup-timeline-export-result" variant={exportResult.variant}>
+                        {exportResult.message}
+                    </HelperTextItem>}
+                </HelperText>
+            </ModalBody>
+            <ModalFooter>
+                <Button id="startup-timeline-export" variant="primary" onClick={onExport}>
+                    {_("Export")}
+                </Button>
+                <Button variant="link" onClick={() => setIsTimelineOpen(false)}>
+                    {_("Close")}
+                </Button>
+            </ModalFooter>
+        </Modal>
+    );
+};
+
 export const HeaderKebab = ({ currentStepId, dispatch, isConnected, onCritFail, reportLinkURL, setShowStorage, showStorage }) => {
     const [isOpen, setIsOpen] = useState(false);
     const [isAboutModalOpen, setIsAboutModalOpen] = useState(false);
     const [isReportIssueOpen, setIsReportIssueOpen] = useState(false);
     const [isNetworkOpen, setIsNetworkOpen] = useState(false);
+    const [isTimelineOpen, setIsTimelineOpen] = useState(false);
     const isBootIso = useContext(SystemTypeContext).systemType === "BOOT_ISO";
 
     const onToggle = () => {
@@ -108,6 +178,10 @@ export const HeaderKebab = ({ currentStepId, dispatch, isConnected, onCritFail,
         setIsNetworkOpen(true);
     };
 
+    const handleTimeline = () => {
+        setIsTimelineOpen(true);
+    };
+
     const dropdownItems = [
         ...(isBootIso
             ? [
@@ -128,6 +202,9 @@ export const HeaderKebab = ({ currentStepId, dispatch, isConnected, onCritFail,
         <DropdownItem id="about-modal-dropdown-item-report" key="report issue" onClick={handleReportIssue}>
             {_("Report Issue")}
         </DropdownItem>,
+        <DropdownItem id="about-modal-dropdown-item-timeline" key="timeline" onClick={handleTimeline}>
+            {_("Startup timeline")}
+        </DropdownItem>,
     ];
 
     return (
@@ -167,6 +244,10 @@ export const HeaderKebab = ({ currentStepId, dispatch, isConnected, onCritFail,
                   setIsReportIssueOpen={setIsReportIssueOpen}
                   isConnected={isConnected}
                 />}
+            {isTimelineOpen &&
+                <StartupTimelineModal
+                  setIsTimelineOpen={setIsTimelineOpen}
+                />}
             {showStorage &&
             <CockpitStorageIntegration
               dispatch={dispatch}
@@ -11,10 +11,11 @@ import { BossClient } from "../apis/boss.js";
 
 import { initialState, reducer, useReducerWithThunk } from "../reducer.js";
 
-import { getInstallerConfValue, parseAnacondaConfBool, readConf } from "../helpers/conf.js";
+import { getAnacondaConf, getRuntimeConf, subscribeConf } from "../helpers/conf.js";
 import { isExiting } from "../helpers/exit.js";
 import { debug } from "../helpers/log.js";
 import { getAnacondaUIVersion, getAnacondaVersion } from "../helpers/product.js";
+import { markOnce } from "../helpers/timeline.js";
 
 import { MainContextWrapper } from "../contexts/Common.jsx";
 
@@ -36,10 +37,15 @@ export const ApplicationLoading = () => (
 
 export const Application = ({ conf, dispatch, isFetching, onCritFail, osRelease, reportLinkURL, setShowStorage, showStorage }) => {
     const [storeInitialized, setStoreInitialized] = useState(false);
+    const [isDataLoaded, setIsDataLoaded] = useState(false);
     const [currentStepId, setCurrentStepId] = useState();
     const address = useAddress(onCritFail);
-    const automatedInstall = parseAnacondaConfBool(getInstallerConfValue(conf, "Runtime", "automated_install"));
-    const pauseAtSummary = parseAnacondaConfBool(getInstallerConfValue(conf, "Runtime", "pause_at_summary"));
+    const { automatedInstall, pauseAtSummary } = getRuntimeConf(conf);
+
+    // The clients are initialized once per address, a later change of the watched
+    // configuration must not initialize them again
+    const confRef = useRef(conf);
+    confRef.current = conf;
 
     useEffect(() => {
         if (!address) {
@@ -68,11 +74,23 @@ export const Application = ({ conf, dispatch, isFetching, onCritFail, osRelease,
         // Attach a click event listener to detect external link clicks
         document.addEventListener("click", allowExternalNavigation);
 
-        new BossClient(address, dispatch).init({ automatedInstall, conf })
-                .then(() => {
-                    setStoreInitialized(true);
-                }, onCritFail({ context: N_("Reading information about the computer failed.") }));
-    }, [address, automatedInstall, conf, dispatch, onCritFail]);
+        // Render the wizard as soon as the first screen has its data,
+        // the remaining data keeps loading in the background
+        const initConf = confRef.current;
+        const { done, ready } = new BossClient(address, dispatch).init({
+            automatedInstall: getRuntimeConf(initConf).automatedInstall,
+            conf: initConf,
+        });
+        Promise.all([
+            ready.then(() => setStoreInitialized(true)),
+            done.then(() => setIsDataLoaded(true)),
+        ]).catch(onCritFail({ context: N_("Reading information about the computer failed.") }));
+
+        return () => {
+            window.removeEventListener("beforeunload", preventExit);
+            document.removeEventListener("click", allowExternalNavigation);
+        };
+    }, [address, dispatch, onCritFail]);
 
     // Postpone rendering anything until we read the dbus address and the default configuration
     if (!address || !storeInitialized) {
@@ -101,6 +119,7 @@ export const Application = ({ conf, dispatch, isFetching, onCritFail, osRelease,
             <AnacondaWizard
               automatedInstall={automatedInstall}
               currentStepId={currentStepId}
+              isDataLoaded={isDataLoaded}
               isFetching={isFetching}
               onCritFail={onCritFail}
               pauseAtSummary={pauseAtSummary}
@@ -116,8 +135,9 @@ export const Application = ({ conf, dispatch, isFetching, onCritFail, osRelease,
 const useConf = ({ onCritFail }) => {
     const [conf, setConf] = useState();
 
+    // The configuration is parsed once and again only when the file changes
     useEffect(() => {
-        readConf().then(setConf, onCritFail({ context: N_("Reading installer configuration failed.") }));
+        return subscribeConf(setConf, onCritFail({ context: N_("Reading installer configuration failed.") }));
     }, [onCritFail]);
 
     return conf;
@@ -143,6 +163,9 @@ const useAddress = (onCritFail) => {
         }
 
         cockpit.file("/run/anaconda/bus.address").watch(address => {
+            if (address) {
+                markOnce("bus-address");
+            }
             setAddress(address);
         });
     }, [backendReady]);
@@ -155,6 +178,7 @@ const useAddress = (onCritFail) => {
                 const isReady = content !== null;
 
                 if (isReady) {
+                    markOnce("backend-ready");
                     wasReadyRef.current = true;
                 }
 
@@ -202,7 +226,7 @@ export const ApplicationWithErrorBoundary = () => {
 
     return (
         <MainContextWrapper state={state} osRelease={osRelease} conf={conf} appVersion={appVersion}>
-            <Page className="no-masthead-sidebar" data-debug={conf.Anaconda.debug}>
+            <Page className="no-masthead-sidebar" data-debug={getAnacondaConf(conf).debug}>
                 <ErrorBoundary
                   backendException={errorBeforeBoundary}
                   showStorage={showStorage}
@@ -4,7 +4,7 @@
  */
 import cockpit from "cockpit";
 
-import React, { useLayoutEffect, useRef, useState } from "react";
+import React, { useDeferredValue, useLayoutEffect, useMemo, useRef, useState } from "react";
 import { Button } from "@patternfly/react-core/dist/esm/components/Button/index.js";
 import { Menu, MenuContent, MenuGroup, MenuItem, MenuList } from "@patternfly/react-core/dist/esm/components/Menu/index.js";
 import { TextInputGroup, TextInputGroupMain, TextInputGroupUtilities } from "@patternfly/react-core/dist/esm/components/TextInputGroup/index.js";
@@ -12,13 +12,26 @@ import { SearchIcon } from "@patternfly/react-icons/dist/esm/icons/search-icon";
 import { TimesIcon } from "@patternfly/react-icons/dist/esm/icons/times-icon";
 
 import { warn as loggerWarn } from "../../helpers/log.js";
+import { getOptionKey, getSearchIndex } from "../../helpers/search.js";
 
 import "./MenuSearch.scss";
 
 const _ = cockpit.gettext;
 
-const renderOptions = (options, scrollRef, selection, search) => {
-    return options.map(option => {
+/* Render the menu options
+ * @param {Array} options - The menu options
+ * @param {Object} scrollRef - Ref attached to the selected item
+ * @param {string|Array} selection - The selected item ID or IDs
+ * @param {Map} ranks - Ranks of the items matching the search keyed by the option key,
+ *                      the matching items are sorted by their rank, null shows all items
+ */
+const renderOptions = (options, scrollRef, selection, ranks) => {
+    const sortedOptions = ranks
+        // The sort is stable, items with the same rank keep their order
+        ? [...options].sort((a, b) => (ranks.get(getOptionKey(a)) ?? 0) - (ranks.get(getOptionKey(b)) ?? 0))
+        : options;
+
+    return sortedOptions.map(option => {
         // Support both single selection (string) and multiple selection (array)
         let isSelected = false;
         if (selection) {
@@ -31,7 +44,7 @@ const renderOptions = (options, scrollRef, selection, search) => {
 
         switch (option.itemType) {
         case "menu-item":
-            if (search && option.onSearch(search) === false) {
+            if (ranks && !ranks.has(getOptionKey(option))) {
                 return null; // Skip items that do not match the search criteria
             }
 
@@ -56,7 +69,7 @@ const renderOptions = (options, scrollRef, selection, search) => {
                 </MenuItem>
             );
         case "menu-group": {
-            const itemChildren = renderOptions(option.itemChildren, scrollRef, selection, search);
+            const itemChildren = renderOptions(option.itemChildren, scrollRef, selection, ranks);
 
             if (itemChildren.filter((item) => item !== null).length === 0) {
                 return null; // Skip empty groups
@@ -93,7 +106,18 @@ export const MenuSearch = ({ ariaLabelSearch, handleOnSelect, menuType, options,
         }
     });
 
-    const menuListContent = renderOptions(options, scrollRef, selection, search);
+    // The index is built once per options array, keep the options memoized in the callers
+    const searchIndex = useMemo(() => getSearchIndex(options), [options]);
+    // Keep typing responsive while the long lists are filtered
+    const deferredSearch = useDeferredValue(search);
+    const ranks = useMemo(
+        () => deferredSearch.trim() ? searchIndex.search(deferredSearch) : null,
+        [deferredSearch, searchIndex]
+    );
+    const menuListContent = useMemo(
+        () => renderOptions(options, scrollRef, selection, ranks),
+        [options, ranks, selection]
+    );
 
     return (
         <>
@@ -5,11 +5,14 @@
 
 import cockpit from "cockpit";
 
-import { DateAndTimePage } from "./DateAndTime.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
+
 import { DateAndTimeReviewDescription } from "./DateAndTimeReviewDescription.jsx";
 
 const _ = cockpit.gettext;
 
+const DateAndTimePage = lazyComponent("date-time", () => import("./DateAndTime.jsx").then(module => module.DateAndTimePage));
+
 export { DateAndTimeReviewDescription };
 
 export class Page {
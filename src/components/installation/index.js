@@ -3,7 +3,9 @@
  * SPDX-License-Identifier: LGPL-2.1-or-later
  */
 
-import { InstallationProgress } from "./InstallationProgress.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
+
+const InstallationProgress = lazyComponent("progress", () => import("./InstallationProgress.jsx").then(module => module.InstallationProgress));
 
 export class Page {
     _description = "Monitor the installation progress and completion.";
@@ -64,6 +64,12 @@ class LanguageSelector extends React.Component {
 
     renderOptions () {
         const { commonLocales, languages } = this.props;
+
+        // Rebuild the options, and so their search index, only when the language list changes
+        if (this.optionsCache?.commonLocales === commonLocales && this.optionsCache?.languages === languages) {
+            return this.optionsCache.options;
+        }
+
         const options = [];
 
         // Returns a locale with a given code.
@@ -79,19 +85,6 @@ class LanguageSelector extends React.Component {
             error(`Locale with code ${localeCode} not found.`);
         };
 
-        const onSearch = (locale, search) => {
-            const searchLower = search.toLowerCase();
-
-            return (
-                getLocaleNativeName(locale).toLowerCase()
-                        .includes(searchLower) ||
-                getLanguageNativeName(locale).toLowerCase()
-                        .includes(searchLower) ||
-                getLanguageEnglishName(locale).toLowerCase()
-                        .includes(searchLower)
-            );
-        };
-
         // Helper to create a menu item
         const createMenuItem = (locale, prefix) => {
             return ({
@@ -102,7 +95,12 @@ class LanguageSelector extends React.Component {
                 itemText: getLocaleNativeName(locale),
                 itemType: "menu-item",
                 key: `${prefix}-${getLocaleId(locale)}`,
-                onSearch: onSearch.bind(null, locale),
+                searchTerms: [
+                    getLocaleNativeName(locale),
+                    getLanguageNativeName(locale),
+                    getLanguageEnglishName(locale),
+                    getLocaleId(locale),
+                ],
             });
         };
 
@@ -151,6 +149,7 @@ class LanguageSelector extends React.Component {
             });
         }
 
+        this.optionsCache = { commonLocales, languages, options };
         return options;
     }
 
@@ -78,13 +78,7 @@ const buildMenuItem = (keyboard) => {
         itemText: description.v,
         itemType: "menu-item",
         key: layoutId?.v,
-        onSearch: search => {
-            const searchLower = search.toLowerCase();
-            return (
-                description.v.toLowerCase().includes(searchLower) ||
-                layoutId?.v.toLowerCase().includes(searchLower)
-            );
-        },
+        searchTerms: [description.v, layoutId?.v],
     };
 };
 
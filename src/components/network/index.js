@@ -5,10 +5,12 @@
 
 import cockpit from "cockpit";
 
-import { NetworkConfiguration } from "./NetworkConfiguration.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
 
 const _ = cockpit.gettext;
 
+const NetworkConfiguration = lazyComponent("network", () => import("./NetworkConfiguration.jsx").then(module => module.NetworkConfiguration));
+
 export class Page {
     _description = "Configure network connections for the system.";
 
@@ -42,7 +42,7 @@ import {
 } from "../storage/index.js";
 import { useScenario } from "../storage/installation-method/InstallationScenario.jsx";
 import { usePageComplete as useStorageInstallationPageComplete } from "../storage/installation-method/usePageComplete.jsx";
-import { AccountsReviewDescription } from "../users/index.js";
+import { AccountsReviewDescription } from "../users/Accounts.jsx";
 import { usePageComplete as useUsersPageComplete } from "../users/usePageComplete.jsx";
 import { ReviewDescriptionListItem } from "./Common.jsx";
 import { HostnameRow } from "./Hostname.jsx";
@@ -79,7 +79,7 @@ const ReviewDescriptionList = ({ children }) => {
 export const ReviewConfiguration = ({ autoProceedBlockedRef, automatedInstall, pauseAtSummary }) => {
     const osRelease = useContext(OsReleaseContext);
     const userInterfaceConfig = useContext(UserInterfaceContext);
-    const hiddenScreens = userInterfaceConfig.hidden_webui_pages || [];
+    const hiddenScreens = userInterfaceConfig.hiddenWebuiPages || [];
     const { goToStepById } = useWizardContext();
     const languagePageHidden = hiddenScreens.includes("anaconda-screen-language");
     const localizationComplete = useLocalizationPageComplete({ isHidden: languagePageHidden });
@@ -5,10 +5,12 @@
 
 import cockpit from "cockpit";
 
-import { ReviewConfiguration } from "./ReviewConfiguration.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
 
 const _ = cockpit.gettext;
 
+const ReviewConfiguration = lazyComponent("review", () => import("./ReviewConfiguration.jsx").then(module => module.ReviewConfiguration));
+
 export class Page {
     _description = "Review your installation settings and start the installation process.";
 
@@ -44,11 +44,7 @@ const EnvironmentSelection = () => {
             itemText: env.name,
             itemType: "menu-item",
             key: `environment-${env.id}`,
-            onSearch: (search) => {
-                const searchLower = search.toLowerCase();
-                return env.name.toLowerCase().includes(searchLower) ||
-                       (env.description && env.description.toLowerCase().includes(searchLower));
-            },
+            searchTerms: [env.name, env.description],
         }));
     }, [environments]);
 
@@ -93,11 +89,7 @@ const GroupPackagesSelection = () => {
             itemText: group.name,
             itemType: "menu-item",
             key: `group-${group.id}`,
-            onSearch: (search) => {
-                const searchLower = search.toLowerCase();
-                return group.name.toLowerCase().includes(searchLower) ||
-                       (group.description && group.description.toLowerCase().includes(searchLower));
-            },
+            searchTerms: [group.name, group.description],
         }));
 
         const visibleGroupItems = visibleGroups.map((group) => ({
@@ -107,11 +99,7 @@ const GroupPackagesSelection = () => {
             itemText: group.name,
             itemType: "menu-item",
             key: `group-${group.id}`,
-            onSearch: (search) => {
-                const searchLower = search.toLowerCase();
-                return group.name.toLowerCase().includes(searchLower) ||
-                       (group.description && group.description.toLowerCase().includes(searchLower));
-            },
+            searchTerms: [group.name, group.description],
         }));
 
         const options = [];
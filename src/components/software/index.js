@@ -5,10 +5,12 @@
 
 import cockpit from "cockpit";
 
-import { SoftwareSelection } from "./SoftwareSelection.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
 
 const _ = cockpit.gettext;
 
+const SoftwareSelection = lazyComponent("software-selection", () => import("./SoftwareSelection.jsx").then(module => module.SoftwareSelection));
+
 export class Page {
     _description = "Select packages to install by choosing a base environment.";
 
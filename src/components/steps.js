@@ -21,7 +21,7 @@ const _ = cockpit.gettext;
 
 export const getSteps = (automatedInstall, userInterfaceConfig, args) => {
     const mountPointMappingStep = new PageMountPointMapping(args);
-    const hiddenScreens = userInterfaceConfig.hidden_webui_pages || [];
+    const hiddenScreens = userInterfaceConfig.hiddenWebuiPages || [];
     const stepsOrder = [
         new PageInstallationLanguage(args),
         new PageNetworkConfiguration(args),
@@ -12,16 +12,13 @@ import { Title } from "@patternfly/react-core/dist/esm/components/Title/index.js
 
 import { setStorageScenarioAction } from "../../../actions/storage-actions.js";
 
-import {
-    getLockedLUKSDevices,
-} from "../../../helpers/storage.js";
-
 import { PageContext, StorageContext } from "../../../contexts/Common.jsx";
 
 import {
-    useOriginalDevices,
+    useStorageSelector,
 } from "../../../hooks/Storage.jsx";
 
+import { selectLockedLUKSDevices } from "../../../selectors/storage-selectors.js";
 import { scenarios, useScenariosAvailability } from "../scenarios/index.js";
 import { USE_CONFIGURED_STORAGE_SCENARIO_IDS } from "../scenarios/use-configured-storage/index.js";
 import { StorageReview } from "../StorageReview.jsx";
@@ -118,17 +115,13 @@ export const InstallationScenario = ({
     setIsScenarioValid,
 }) => {
     const headingLevel = isFirstScreen ? "h3" : "h2";
-    const { diskSelection, storageScenarioId } = useContext(StorageContext);
-    const devices = useOriginalDevices();
+    const { storageScenarioId } = useContext(StorageContext);
     const scenarioAvailability = useScenariosAvailability();
     const noScenariosAvailable = !Object.values(scenarioAvailability || {}).some(scenario => (
         scenario.available && !scenario.hidden
     ));
 
-    const lockedLUKSDevices = useMemo(
-        () => getLockedLUKSDevices(diskSelection.selectedDisks, devices),
-        [devices, diskSelection.selectedDisks]
-    );
+    const lockedLUKSDevices = useStorageSelector(selectLockedLUKSDevices);
 
     const showLuksUnlock = lockedLUKSDevices?.length > 0;
 
@@ -5,14 +5,17 @@
 
 import cockpit from "cockpit";
 
+import { lazyComponent } from "../../../helpers/chunks.js";
+
 import { usePartitioningReset } from "../../../hooks/Storage.jsx";
 
-import { InstallationMethod } from "./InstallationMethod.jsx";
 import { StorageInstallationReviewSummary } from "./StorageInstallationReviewSummary.jsx";
 import { StorageScenarioReviewDescription } from "./StorageScenarioReviewDescription.jsx";
 
 const _ = cockpit.gettext;
 
+const InstallationMethod = lazyComponent("method", () => import("./InstallationMethod.jsx").then(module => module.InstallationMethod));
+
 export { StorageInstallationReviewSummary, StorageScenarioReviewDescription };
 
 export class Page {
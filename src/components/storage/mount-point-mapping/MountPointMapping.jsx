@@ -5,7 +5,7 @@
 
 import cockpit from "cockpit";
 
-import React, { useCallback, useContext, useEffect, useMemo, useRef, useState } from "react";
+import React, { useCallback, useContext, useEffect, useMemo, useState } from "react";
 import { Button } from "@patternfly/react-core/dist/esm/components/Button/index.js";
 import { HelperText, HelperTextItem } from "@patternfly/react-core/dist/esm/components/HelperText/index.js";
 import { Label } from "@patternfly/react-core/dist/esm/components/Label/index.js";
@@ -19,7 +19,6 @@ import { TrashIcon } from "@patternfly/react-icons/dist/esm/icons/trash-icon";
 
 import {
     applyStorage,
-    gatherRequests,
     setManualPartitioningRequests
 } from "../../../apis/storage_partitioning.js";
 
@@ -27,21 +26,20 @@ import {
     filterPartitioningRequests,
     getDeviceAncestors,
     getDeviceChildren,
-    getLockedLUKSDevices,
     getMountPointFormatConstraintError,
     hasDuplicateFields,
     isDuplicateRequestField,
-    requestsFromDbus,
     requestsToDbus,
 } from "../../../helpers/storage.js";
 
 import { PageContext, StorageContext } from "../../../contexts/Common.jsx";
 
-import { getNewPartitioning, useMountPointConstraints, useOriginalDevices } from "../../../hooks/Storage.jsx";
+import { useMountPointConstraints, useOriginalDevices, useStorageSelector } from "../../../hooks/Storage.jsx";
 
 import { EmptyStatePanel } from "cockpit-components-empty-state.jsx";
 import { ListingTable } from "cockpit-components-table.jsx";
 
+import { selectLockedLUKSDevices } from "../../../selectors/storage-selectors.js";
 import { AnacondaWizardFooter } from "../../AnacondaWizardFooter.jsx";
 import { createStorageValidationNotification } from "../Common.jsx";
 
@@ -549,10 +547,7 @@ const RequestsTable = ({
         return requests?.filter(r => isUsableDevice(r["device-spec"], deviceData)).map(r => r["device-spec"]) || [];
     }, [requests, deviceData]);
     const isLoadingPartitioning = mountPointConstraints === undefined || !requests;
-    const lockedLUKSDevices = useMemo(
-        () => getLockedLUKSDevices(selectedDisks, deviceData),
-        [deviceData, selectedDisks]
-    );
+    const lockedLUKSDevices = useStorageSelector(selectLockedLUKSDevices);
 
     // Initialize unappliedRequests from partitioning.requests when they're ready
     useEffect(() => {
@@ -665,56 +660,6 @@ const isUsableDevice = (devSpec, deviceData) => {
     return false;
 };
 
-export const usePartitioningReuse = () => {
-    const { setIsFormDisabled } = useContext(PageContext) ?? {};
-    const { partitioning } = useContext(StorageContext);
-    const previousRequestsRef = useRef();
-    const mergedRequestsRef = useRef();
-
-    useEffect(() => {
-        const _updateInitialRequests = async () => {
-            if (previousRequestsRef.current !== undefined) {
-                return;
-            }
-
-            // Store previous requests before creating new partitioning
-            previousRequestsRef.current = partitioning?.requests || [];
-
-            const part = await getNewPartitioning({ method: "MANUAL", storageScenarioId: "mount-point-mapping" });
-            const newRequestsDbus = await gatherRequests({ partitioning: part });
-            const newRequests = requestsFromDbus(newRequestsDbus);
-
-            // Merge old requests into new requests by device-spec
-            const _mergedRequests = newRequests.map(newReq => {
-                if (!newReq["device-spec"]) {
-                    return newReq;
-                }
-                const oldReq = previousRequestsRef.current.find(old => old["device-spec"] === newReq["device-spec"]);
-                return oldReq || newReq;
-            });
-
-            mergedRequestsRef.current = _mergedRequests;
-
-            // Set merged requests on the new partitioning (context will auto-update)
-            await setManualPartitioningRequests({
-                partitioning: part,
-                requests: requestsToDbus(_mergedRequests),
-            });
-        };
-
-        _updateInitialRequests();
-    }, [partitioning?.requests]);
-
-    // Wait for partitioning.requests to be updated with merged requests
-    useEffect(() => {
-        if (!partitioning?.requests || !mergedRequestsRef.current) {
-            return;
-        }
-
-        setIsFormDisabled(false);
-    }, [partitioning?.requests, setIsFormDisabled]);
-};
-
 export const MountPointMapping = () => {
     // Display custom footer
     const getFooter = useMemo(() => <CustomFooter />, []);
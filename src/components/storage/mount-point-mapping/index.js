@@ -5,10 +5,14 @@
 
 import cockpit from "cockpit";
 
-import { MountPointMapping, usePartitioningReuse } from "./MountPointMapping.jsx";
+import { lazyComponent } from "../../../helpers/chunks.js";
+
+import { usePartitioningReuse } from "../../../hooks/Storage.jsx";
 
 const _ = cockpit.gettext;
 
+const MountPointMapping = lazyComponent("mount-point-mapping", () => import("./MountPointMapping.jsx").then(module => module.MountPointMapping));
+
 export class Page {
     _description = "Manual configuration of disk partitions and mount points for advanced storage setups.";
 
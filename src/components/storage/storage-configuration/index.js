@@ -5,13 +5,16 @@
 
 import cockpit from "cockpit";
 
+import { lazyComponent } from "../../../helpers/chunks.js";
+
 import { usePartitioningReset } from "../../../hooks/Storage.jsx";
 
 import { USE_CONFIGURED_STORAGE_SCENARIO_IDS } from "../scenarios/use-configured-storage/index.js";
-import { StorageConfiguration } from "./StorageConfiguration.jsx";
 
 const _ = cockpit.gettext;
 
+const StorageConfiguration = lazyComponent("storage-configuration", () => import("./StorageConfiguration.jsx").then(module => module.StorageConfiguration));
+
 export class Page {
     _description = "Automatic partitioning configuration, disk encryption, and storage options.";
 
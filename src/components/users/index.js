@@ -5,11 +5,11 @@
 
 import cockpit from "cockpit";
 
-import { Accounts, AccountsReviewDescription } from "./Accounts.jsx";
+import { lazyComponent } from "../../helpers/chunks.js";
 
 const _ = cockpit.gettext;
 
-export { AccountsReviewDescription };
+const Accounts = lazyComponent("accounts", () => import("./Accounts.jsx").then(module => module.Accounts));
 
 export class Page {
     _description = "Set up user accounts and administrator passwords for your system.";
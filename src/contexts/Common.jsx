@@ -4,10 +4,12 @@
  */
 import cockpit from "cockpit";
 
-import React, { createContext, useEffect, useState } from "react";
+import React, { createContext, useEffect, useMemo, useState } from "react";
 import { Popover, PopoverPosition } from "@patternfly/react-core/dist/esm/components/Popover/index.js";
 import { HelpIcon } from "@patternfly/react-icons/dist/esm/icons/help-icon";
 
+import { getInstallationSystemConf, getInstallationTargetConf, getStorageConf, getUserInterfaceConf } from "../helpers/conf.js";
+
 import { WithDialogs } from "dialogs.jsx";
 
 export const PageContext = createContext(null);
@@ -44,10 +46,17 @@ export const FormGroupHelpPopover = ({ helpContent }) => {
 };
 
 const ModuleContextWrapper = ({ children, state }) => {
+    // The substates keep their identity until they change, keep the merged value stable as well
+    // so that the storage consumers do not re-render on unrelated dispatches
+    const storage = useMemo(
+        () => ({ ...state.storage, isFetching: state.misc.isFetching }),
+        [state.storage, state.misc.isFetching]
+    );
+
     return (
         <LanguageContext.Provider value={state.localization}>
             <RuntimeContext.Provider value={state.runtime}>
-                <StorageContext.Provider value={{ ...state.storage, isFetching: state.misc.isFetching }}>
+                <StorageContext.Provider value={storage}>
                     <UsersContext.Provider value={state.users}>
                         <NetworkContext.Provider value={state.network}>
                             <PayloadContext.Provider value={state.payload}>
@@ -76,15 +85,18 @@ const SystemInfoContextWrapper = ({ appVersion, children, conf, osRelease }) =>
         });
     }, []);
 
-    const systemType = conf?.["Installation System"].type;
-    const defaultScheme = conf?.Storage.default_scheme;
+    const { systemType } = getInstallationSystemConf(conf);
+    const { defaultScheme } = getStorageConf(conf);
+    const { systemRoot } = getInstallationTargetConf(conf);
+    const systemTypeValue = useMemo(() => ({ desktopVariant, systemType }), [desktopVariant, systemType]);
+    const storageDefaults = useMemo(() => ({ defaultScheme }), [defaultScheme]);
 
     return (
         <OsReleaseContext.Provider value={osRelease}>
-            <SystemTypeContext.Provider value={{ desktopVariant, systemType }}>
-                <StorageDefaultsContext.Provider value={{ defaultScheme }}>
-                    <TargetSystemRootContext.Provider value={conf["Installation Target"].system_root}>
-                        <UserInterfaceContext.Provider value={conf["User Interface"]}>
+            <SystemTypeContext.Provider value={systemTypeValue}>
+                <StorageDefaultsContext.Provider value={storageDefaults}>
+                    <TargetSystemRootContext.Provider value={systemRoot}>
+                        <UserInterfaceContext.Provider value={getUserInterfaceConf(conf)}>
                             <AppVersionContext.Provider value={appVersion}>
                                 {children}
                             </AppVersionContext.Provider>
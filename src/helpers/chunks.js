@@ -0,0 +1,65 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+import { createElement, lazy } from "react";
+
+import { timeSpan } from "./timeline.js";
+
+/* Create a component whose module is built into a separate chunk
+ * - the chunk is loaded on the first render of the component or when preloaded
+ * - the time to fetch, parse and evaluate the chunk is recorded as the 'chunk:<name>' span
+ * - a failed load is retried by the next preload or render of the component
+ * @param {string} name - The name of the chunk shown in the timeline
+ * @param {Function} load - Function importing the module, resolves the component
+ * @returns {Object} The lazy component, its `preload` method starts loading the chunk
+ */
+export const lazyComponent = (name, load) => {
+    let promise;
+
+    const preload = () => {
+        if (!promise) {
+            promise = timeSpan(`chunk:${name}`, load);
+            // Let the next attempt load the chunk again, for example after a network hiccup
+            promise.catch(() => {
+                promise = undefined;
+            });
+        }
+
+        return promise;
+    };
+
+    // React.lazy keeps the rejection of a failed load, render a new lazy component after a failure
+    const createLazyComponent = () => lazy(() => preload().then(
+        component => ({ default: component }),
+        exc => {
+            LazyComponent = createLazyComponent();
+            throw exc;
+        }
+    ));
+    let LazyComponent = createLazyComponent();
+
+    const Component = props => createElement(LazyComponent, props);
+    Component.preload = preload;
+
+    return Component;
+};
+
+/* Start loading the chunk of a lazy component once the browser is idle
+ * @param {Object} component - A component created with lazyComponent
+ * @returns {Function} Cancels the scheduled loading
+ */
+export const preloadWhenIdle = (component) => {
+    if (!component?.preload) {
+        return () => {};
+    }
+
+    if (window.requestIdleCallback) {
+        const handle = window.requestIdleCallback(() => component.preload().catch(() => {}));
+        return () => window.cancelIdleCallback(handle);
+    }
+
+    const timer = setTimeout(() => component.preload().catch(() => {}), 1000);
+    return () => clearTimeout(timer);
+};
@@ -4,6 +4,8 @@
  */
 import cockpit from "cockpit";
 
+import { warn } from "./log.js";
+
 const CONF_PATH = "/run/anaconda/anaconda.conf";
 
 const isEmpty = (inStr) => {
@@ -81,9 +83,158 @@ export const parseAnacondaConfBool = (raw) => {
     return t === "true" || t === "yes" || t === "1";
 };
 
-export const readConf = () => {
-    const confFile = cockpit.file(CONF_PATH, { superuser: "try", });
-    return confFile.read()
-            .then(parseIni)
-            .finally(confFile.close);
+/* The configuration parsed from the latest content of the file, shared by all readers */
+let sharedConf;
+let sharedContent;
+
+const confSubscribers = new Set();
+let confWatch = null;
+
+const deepFreeze = (obj) => {
+    Object.values(obj).forEach(value => {
+        if (value && typeof value === "object") {
+            deepFreeze(value);
+        }
+    });
+
+    return Object.freeze(obj);
+};
+
+/* Parse the content of the configuration file, unless it is the content parsed last time
+ * @param {string|null} content
+ * @returns {object|undefined} The immutable configuration, the same object for the same content
+ */
+const updateSharedConf = (content) => {
+    if (content !== sharedContent) {
+        const conf = parseIni(content);
+
+        // Keep the last configuration while the file is missing or being rewritten
+        if (conf) {
+            sharedContent = content;
+            sharedConf = deepFreeze(conf);
+        }
+    }
+
+    return sharedConf;
+};
+
+/**
+ * Subscribe to the installer configuration, the file is watched while there are subscribers.
+ * The file is parsed again only when its content changes, all subscribers receive the same
+ * immutable configuration object.
+ * @param {Function} onChange   Called with the configuration, immediately if it was already parsed
+ * @param {Function} onError    Called with the exception if the file can not be read
+ *                              before the configuration was parsed the first time
+ * @returns {Function} Removes the subscription
+ */
+export const subscribeConf = (onChange, onError) => {
+    const subscriber = { onChange, onError };
+    confSubscribers.add(subscriber);
+
+    if (sharedConf) {
+        onChange(sharedConf);
+    }
+
+    if (!confWatch) {
+        const file = cockpit.file(CONF_PATH, { superuser: "try", });
+        const handle = file.watch((content, tag, exc) => {
+            if (exc) {
+                // Once the configuration was read, keep it over a transient failure of the watch
+                if (sharedConf) {
+                    warn("Watching the installer configuration failed", exc);
+                } else {
+                    confSubscribers.forEach(s => s.onError?.(exc));
+                }
+                return;
+            }
+
+            const previousConf = sharedConf;
+            const conf = updateSharedConf(content);
+            if (conf && conf !== previousConf) {
+                confSubscribers.forEach(s => s.onChange(conf));
+            }
+        });
+        confWatch = { file, handle };
+    }
+
+    return () => {
+        confSubscribers.delete(subscriber);
+
+        if (confSubscribers.size === 0 && confWatch) {
+            confWatch.handle.remove();
+            confWatch.file.close();
+            confWatch = null;
+        }
+    };
+};
+
+/* Typed views of the configuration sections, computed once per configuration object */
+const sectionCache = new WeakMap();
+
+const getSection = (conf, name, build) => {
+    if (!conf) {
+        return Object.freeze(build({}));
+    }
+    if (!sectionCache.has(conf)) {
+        sectionCache.set(conf, {});
+    }
+
+    const sections = sectionCache.get(conf);
+    if (!(name in sections)) {
+        sections[name] = Object.freeze(build(conf[name] || {}));
+    }
+
+    return sections[name];
 };
+
+/**
+ * @param {object} conf
+ * @returns {{debug: string|undefined}}
+ */
+export const getAnacondaConf = conf => getSection(conf, "Anaconda", section => ({
+    debug: section.debug,
+}));
+
+/**
+ * @param {object} conf
+ * @returns {{automatedInstall: boolean, pauseAtSummary: boolean}}
+ */
+export const getRuntimeConf = conf => getSection(conf, "Runtime", section => ({
+    automatedInstall: parseAnacondaConfBool(section.automated_install),
+    pauseAtSummary: parseAnacondaConfBool(section.pause_at_summary),
+}));
+
+/**
+ * @param {object} conf
+ * @returns {{canChangeRoot: boolean, canChangeUsers: boolean, hiddenWebuiPages: string[]}}
+ */
+export const getUserInterfaceConf = conf => getSection(conf, "User Interface", section => ({
+    canChangeRoot: parseAnacondaConfBool(section.can_change_root),
+    canChangeUsers: parseAnacondaConfBool(section.can_change_users),
+    // A whitespace separated list, usually one page ID per line
+    hiddenWebuiPages: Object.freeze((section.hidden_webui_pages || "").split(/\s+/).filter(Boolean)),
+}));
+
+/**
+ * @param {object} conf
+ * @returns {{defaultScheme: string|undefined}}
+ */
+export const getStorageConf = conf => getSection(conf, "Storage", section => ({
+    defaultScheme: section.default_scheme,
+}));
+
+/**
+ * @param {object} conf
+ * @returns {{systemType: string|undefined}}
+ */
+export const getInstallationSystemConf = conf => getSection(conf, "Installation System", section => ({
+    systemType: section.type,
+}));
+
+/**
+ * @param {object} conf
+ * @returns {{systemRoot: string|undefined}}
+ */
+export const getInstallationTargetConf = conf => getSection(conf, "Installation Target", section => ({
+    systemRoot: section.system_root,
+}));
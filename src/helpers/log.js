@@ -14,25 +14,192 @@ if (typeof Error.prototype.toJSON !== "function") {
 }
 
 const LOG_FILE = "/tmp/anaconda-webui.log";
+/* Buffered messages are written after this many milliseconds... */
+const FLUSH_INTERVAL = 500;
+/* ...or once the buffer grows over this many characters */
+const FLUSH_SIZE = 64 * 1024;
+/* The log file is rotated to LOG_FILE.1 when it would grow over this size */
+const MAX_LOG_SIZE = 50 * 1024 * 1024;
+
+/* Append-only writer keeping one long-lived process which appends its input to the file */
+class LogWriter {
+    constructor (path) {
+        this.path = path;
+        this.buffer = [];
+        this.bufferSize = 0;
+        this.fileSize = 0;
+        this.process = null;
+        this.timer = null;
+
+        cockpit.spawn(["stat", "-c", "%s", path], { err: "ignore" })
+                .then(size => { this.fileSize += Number(size) || 0 })
+                .catch(() => {});
+    }
+
+    _open (rotate) {
+        if (rotate) {
+            // Close the current writer, it finishes writing into the rotated file
+            this.process?.input();
+            this.process = null;
+        }
+
+        if (!this.process) {
+            const script = rotate ? "mv -f \"$0\" \"$0.1\"; exec cat >> \"$0\"" : "exec cat >> \"$0\"";
+            const process = cockpit.spawn(["sh", "-c", script, this.path], { err: "message" });
+
+            // Start a new writer on the next flush if this one dies
+            process.catch(() => {
+                if (this.process === process) {
+                    this.process = null;
+                }
+            });
+            this.process = process;
+        }
+
+        return this.process;
+    }
+
+    write (message) {
+        this.buffer.push(message);
+        this.bufferSize += message.length;
+
+        if (this.bufferSize >= FLUSH_SIZE) {
+            this.flush();
+        } else if (!this.timer) {
+            this.timer = setTimeout(() => this.flush(), FLUSH_INTERVAL);
+        }
+    }
+
+    flush () {
+        clearTimeout(this.timer);
+        this.timer = null;
+
+        if (this.buffer.length === 0) {
+            return;
+        }
+
+        const data = this.buffer.join("");
+        this.buffer = [];
+        this.bufferSize = 0;
+
+        const rotate = this.fileSize + data.length > MAX_LOG_SIZE;
+        if (rotate) {
+            this.fileSize = 0;
+        }
+
+        this._open(rotate).input(data, true);
+        this.fileSize += data.length;
+    }
+}
+
+/* Journal priorities as defined in syslog(3) */
+const JOURNAL_PRIORITIES = { debug: 7, err: 3, info: 6, warning: 4 };
+/* At most this many entries wait for the journal writer, the oldest ones are dropped */
+const JOURNAL_QUEUE_SIZE = 100;
+/* Longer entries are truncated to this many bytes, logger splits lines longer than its
+ * --size limit into entries without the priority, the limit leaves room for the prefix
+ */
+const JOURNAL_MESSAGE_SIZE = 64 * 1024;
+const JOURNAL_LOGGER_SIZE = JOURNAL_MESSAGE_SIZE + 1024;
+const JOURNAL_TRUNCATED = "...(truncated)";
+
+/* Journal sink keeping one long-lived logger process which reads one entry per line */
+class JournalWriter {
+    constructor (tag) {
+        this.tag = tag;
+        this.queue = [];
+        this.dropped = 0;
+        this.droppedReported = 0;
+        this.process = null;
+        this.timer = null;
+    }
+
+    _open () {
+        if (!this.process) {
+            const process = cockpit.spawn(
+                ["logger", "--prio-prefix", "--size", String(JOURNAL_LOGGER_SIZE), "-t", this.tag],
+                { err: "message" }
+            );
+
+            // Start a new writer on the next flush if this one dies
+            process.catch(() => {
+                if (this.process === process) {
+                    this.process = null;
+                }
+            });
+            this.process = process;
+        }
+
+        return this.process;
+    }
+
+    _format (priority, fields) {
+        // JSON escapes the new lines, so each entry stays on a single line
+        let message = JSON.stringify(fields);
+
+        const encoded = new TextEncoder().encode(message);
+        if (encoded.length > JOURNAL_MESSAGE_SIZE) {
+            // A multi-byte character cut in half is decoded as a replacement character
+            message = new TextDecoder().decode(encoded.slice(0, JOURNAL_MESSAGE_SIZE - JOURNAL_TRUNCATED.length)) + JOURNAL_TRUNCATED;
+        }
+
+        return `<${JOURNAL_PRIORITIES[priority]}>${message}\n`;
+    }
+
+    /* Queue a structured journal entry
+     * @param {string} priority - One of the JOURNAL_PRIORITIES names
+     * @param {Array} fields - Values serialized as JSON into the entry
+     */
+    write (priority, fields) {
+        if (this.queue.length >= JOURNAL_QUEUE_SIZE) {
+            this.queue.shift();
+            this.dropped++;
+        }
+        this.queue.push(this._format(priority, fields));
+
+        if (!this.timer) {
+            this.timer = setTimeout(() => this.flush());
+        }
+    }
+
+    flush () {
+        clearTimeout(this.timer);
+        this.timer = null;
+
+        if (this.dropped > this.droppedReported) {
+            this.queue.unshift(this._format("warning", [`Dropped ${this.dropped - this.droppedReported} journal entries`]));
+            this.droppedReported = this.dropped;
+        }
+
+        if (this.queue.length === 0) {
+            return;
+        }
+
+        this._open().input(this.queue.join(""), true);
+        this.queue = [];
+    }
+}
 
 class Logger {
     constructor () {
-        this.logger = cockpit.file(LOG_FILE);
+        this.logger = new LogWriter(LOG_FILE);
+        this.journal = new JournalWriter("anaconda-webui");
+
+        window.addEventListener("beforeunload", () => {
+            this.logger.flush();
+            this.journal.flush();
+        });
     }
 
     _stringifyArgs (args) {
         return JSON.stringify(args);
     }
 
-    _write_to_journal (level, args) {
-        return cockpit.spawn(["logger", "-t", "anaconda-webui", "-p", level, this._stringifyArgs(args)]);
-    }
-
     _write (level, args) {
         const timestamp = new Date().toISOString();
         const message = `${timestamp} [${level}] ${this._stringifyArgs(args)}\n`;
 
-        this.logger.modify(oldContent => oldContent + message);
+        this.logger.write(message);
     }
 
     debug (...args) {
@@ -49,7 +216,8 @@ class Logger {
         // eslint-disable-next-line no-console
         console.error(args);
         this._write("ERROR", args);
-        this._write_to_journal("err", args);
+        this.logger.flush();
+        this.journal.write("err", args);
     }
 
     warn (...args) {
@@ -0,0 +1,87 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+import cockpit from "cockpit";
+
+import { warn } from "./log.js";
+
+/* Upper bounds of the latency histogram buckets in milliseconds */
+export const LATENCY_BUCKETS = [10, 50, 100, 250, 500, 1000, 5000, Infinity];
+
+export const DBUS_STATS_FILE = "/tmp/anaconda-webui-dbus-stats.json";
+
+/* Calls taking longer than this many milliseconds are logged,
+ * can be overridden with the 'anaconda-webui-slow-call-threshold' session storage key
+ */
+const slowCallThreshold = Number(window.sessionStorage.getItem("anaconda-webui-slow-call-threshold")) || 1000;
+
+const callStats = new Map();
+
+/* Describe the call arguments without their values, these can contain passphrases
+ * @param {Array} args - The arguments of the call
+ * @returns {Array} The types of the arguments
+ */
+const redactArgs = (args) => {
+    return args.map(arg => Array.isArray(arg) ? `<array of ${arg.length}>` : `<${typeof arg}>`);
+};
+
+/* Record the outcome of a DBus call
+ * @param {string} method - The name of the called method, including its interface
+ * @param {Array} args - The arguments of the call
+ * @param {number} duration - The duration of the call in milliseconds
+ * @param {boolean} failed - True if the call failed
+ */
+export const recordCall = ({ args = [], duration, failed = false, method }) => {
+    if (!callStats.has(method)) {
+        callStats.set(method, {
+            buckets: LATENCY_BUCKETS.map(() => 0),
+            count: 0,
+            errors: 0,
+            maxDuration: 0,
+            totalDuration: 0,
+        });
+    }
+
+    const stats = callStats.get(method);
+    stats.buckets[LATENCY_BUCKETS.findIndex(bound => duration <= bound)]++;
+    stats.count++;
+    stats.errors += failed ? 1 : 0;
+    stats.maxDuration = Math.max(stats.maxDuration, duration);
+    stats.totalDuration += duration;
+
+    if (duration > slowCallThreshold) {
+        warn(`Slow DBus call ${method} took ${Math.round(duration)} ms`, redactArgs(args));
+    }
+};
+
+/* Get a snapshot of the recorded DBus call statistics
+ * @returns {Object} The statistics keyed by the method name
+ */
+export const getCallStats = () => {
+    return Object.fromEntries([...callStats.entries()].map(([method, stats]) => [
+        method,
+        {
+            ...stats,
+            buckets: Object.fromEntries(LATENCY_BUCKETS.map((bound, i) => [
+                bound === Infinity ? "+Inf" : `<=${bound}ms`,
+                stats.buckets[i],
+            ])),
+            errorRate: stats.errors / stats.count,
+            meanDuration: stats.totalDuration / stats.count,
+        },
+    ]));
+};
+
+/* Write a snapshot of the DBus call statistics as JSON next to the other installer logs
+ * @param {Object} sections - Additional DBus diagnostics written next to the call statistics
+ * @returns {Promise} Resolves the path of the written file
+ */
+export const exportCallStats = (sections = {}) => {
+    const file = cockpit.file(DBUS_STATS_FILE, { superuser: "try" });
+
+    return file.replace(JSON.stringify({ calls: getCallStats(), ...sections }, null, 2))
+            .then(() => DBUS_STATS_FILE)
+            .finally(file.close);
+};
@@ -0,0 +1,67 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+import { error } from "./log.js";
+
+/* Coalesce bursts of change signals into one refetch per slice of the store
+ * - a signal marks its slice dirty, the dirty slices are refetched once no signal
+ *   arrived for `quietPeriod` milliseconds, but at most `maxDelay` milliseconds after
+ *   the first signal of the burst
+ * - marking a slice dirty again replaces its pending refetch, the latest one wins
+ * - signals arriving while a slice is being refetched mark it dirty again, it is
+ *   refetched once more after the running refetch finishes
+ * @param {number} quietPeriod - Milliseconds without signals before the refetch starts
+ * @param {number} maxDelay - Maximum milliseconds a refetch is postponed by a signal storm
+ * @returns {Object} The `markDirty(slice, refetch)` and `cancel()` functions
+ */
+export const createRefetchQueue = ({ maxDelay = 500, quietPeriod = 50 } = {}) => {
+    const dirty = new Map();
+    const running = new Set();
+    let burstStart = null;
+    let timer = null;
+
+    const flush = () => {
+        timer = null;
+        burstStart = null;
+
+        [...dirty.entries()]
+                .filter(([slice]) => !running.has(slice))
+                .forEach(([slice, refetch]) => {
+                    dirty.delete(slice);
+                    running.add(slice);
+
+                    Promise.resolve()
+                            .then(refetch)
+                            .catch(ex => error(`Failed to refetch ${slice}`, ex))
+                            .finally(() => {
+                                running.delete(slice);
+                                if (dirty.has(slice)) {
+                                    schedule();
+                                }
+                            });
+                });
+    };
+
+    const schedule = () => {
+        const now = Date.now();
+        burstStart = burstStart ?? now;
+
+        clearTimeout(timer);
+        timer = setTimeout(flush, Math.max(0, Math.min(quietPeriod, burstStart + maxDelay - now)));
+    };
+
+    return {
+        cancel: () => {
+            clearTimeout(timer);
+            timer = null;
+            burstStart = null;
+            dirty.clear();
+        },
+        markDirty: (slice, refetch) => {
+            dirty.set(slice, refetch);
+            schedule();
+        },
+    };
+};
@@ -0,0 +1,51 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+/* Run the given steps, each one as soon as all the steps it depends on have finished
+ * - steps without dependencies between them run concurrently
+ * @param {Array} steps - Objects with the step `id`, the `run` function and optionally
+ *                        the list of step IDs in `after`
+ * @returns {Object} The `promises` of the steps and their `timings`, both keyed by the step ID
+ */
+export const scheduleSteps = (steps) => {
+    const stepsById = Object.fromEntries(steps.map(step => [step.id, step]));
+    const promises = {};
+    const timings = {};
+    const visiting = new Set();
+
+    const schedule = (id) => {
+        if (promises[id]) {
+            return promises[id];
+        }
+
+        const step = stepsById[id];
+        if (!step) {
+            throw new Error(`Unknown initialization step '${id}'`);
+        }
+        if (visiting.has(id)) {
+            throw new Error(`Initialization step '${id}' depends on itself`);
+        }
+
+        visiting.add(id);
+        const dependencies = (step.after || []).map(schedule);
+        visiting.delete(id);
+
+        promises[id] = Promise.all(dependencies).then(async () => {
+            const start = performance.now();
+
+            try {
+                return await step.run();
+            } finally {
+                timings[id] = { duration: performance.now() - start, start };
+            }
+        });
+
+        return promises[id];
+    };
+
+    steps.forEach(step => schedule(step.id));
+
+    return { promises, timings };
+};
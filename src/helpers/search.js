@@ -0,0 +1,102 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+/* Ranks of a match, lower ranks are shown first */
+const RANK_EXACT = 0;
+const RANK_PREFIX = 1;
+const RANK_WORD_PREFIX = 2;
+const RANK_SUBSTRING = 3;
+
+const WORD_SEPARATOR = /[^\p{L}\p{N}]+/u;
+
+/* Normalize a text for searching, case and accents are ignored
+ * @param {string} text
+ * @returns {string} The lower case text without diacritical marks
+ */
+export const normalizeSearchText = text => (
+    String(text ?? "")
+            .normalize("NFKD")
+            .replace(/\p{M}/gu, "")
+            .toLowerCase()
+            .trim()
+);
+
+/* Get the key identifying a menu option
+ * @param {Object} option
+ * @returns {string}
+ */
+export const getOptionKey = option => option.key || option.id;
+
+const collectEntries = (options, entries) => {
+    options.forEach(option => {
+        if (option.itemType === "menu-group") {
+            collectEntries(option.itemChildren, entries);
+        } else if (option.itemType === "menu-item") {
+            const texts = option.searchTerms || [option.itemText];
+            const terms = [...new Set(texts.filter(text => typeof text === "string").map(normalizeSearchText))];
+            const words = [...new Set(terms.flatMap(term => term.split(WORD_SEPARATOR)).filter(Boolean))];
+
+            entries.push({ key: getOptionKey(option), terms, words });
+        }
+    });
+};
+
+const rankEntry = (entry, needle) => {
+    if (entry.terms.includes(needle)) {
+        return RANK_EXACT;
+    }
+    if (entry.terms.some(term => term.startsWith(needle))) {
+        return RANK_PREFIX;
+    }
+    if (entry.words.some(word => word.startsWith(needle))) {
+        return RANK_WORD_PREFIX;
+    }
+    if (entry.terms.some(term => term.includes(needle))) {
+        return RANK_SUBSTRING;
+    }
+};
+
+/* Build a search index of the menu items
+ * - every item is indexed by its 'searchTerms', or by its 'itemText' if it has none
+ * - the terms and their words are normalized once, when the index is built
+ * @param {Array} options - The menu options, menu groups are searched recursively
+ * @returns {Object} The index, its `search(query)` method returns the ranks of the matching
+ *                   items keyed by the option key, lower ranks match better
+ */
+export const createSearchIndex = (options) => {
+    const entries = [];
+    collectEntries(options, entries);
+
+    return {
+        search: (query) => {
+            const needle = normalizeSearchText(query);
+            const ranks = new Map();
+
+            entries.forEach(entry => {
+                const rank = rankEntry(entry, needle);
+                if (rank !== undefined) {
+                    ranks.set(entry.key, rank);
+                }
+            });
+
+            return ranks;
+        },
+        size: entries.length,
+    };
+};
+
+const searchIndexes = new WeakMap();
+
+/* Get the search index of the menu options, the index is built once per options array
+ * @param {Array} options
+ * @returns {Object} The index created by createSearchIndex
+ */
+export const getSearchIndex = (options) => {
+    if (!searchIndexes.has(options)) {
+        searchIndexes.set(options, createSearchIndex(options));
+    }
+
+    return searchIndexes.get(options);
+};
@@ -24,6 +24,95 @@ export const requestsToDbus = (requests) => {
     });
 };
 
+/* Device graphs keyed by the device data object they were built from,
+ * every device tree snapshot in the store gets its own graph
+ */
+const deviceGraphs = new WeakMap();
+
+const createDeviceGraph = (deviceData) => {
+    const ancestors = new Map();
+    const descendants = new Map();
+    const diskMembers = new Map();
+
+    const getParents = device => deviceData[device]?.parents?.v || [];
+    const getChildren = device => deviceData[device]?.children?.v || [];
+
+    // Depth-first closure, every device is listed once at its first occurrence
+    const getClosure = (cache, getEdges, device) => {
+        if (!cache.has(device)) {
+            const closure = new Set();
+
+            getEdges(device).forEach(next => {
+                closure.add(next);
+                getClosure(cache, getEdges, next).forEach(dev => closure.add(dev));
+            });
+            cache.set(device, [...closure]);
+        }
+
+        return cache.get(device);
+    };
+
+    const byName = new Map();
+    const pathCandidates = new Map();
+    Object.keys(deviceData).forEach(device => {
+        const name = deviceData[device].name?.v;
+        if (name !== undefined && !byName.has(name)) {
+            byName.set(name, device);
+        }
+
+        // The device path and its /dev/disk/by-* links
+        const paths = new Set([deviceData[device].path?.v, ...(deviceData[device].links?.v || [])]);
+        paths.forEach(path => {
+            if (path) {
+                pathCandidates.set(path, [...(pathCandidates.get(path) || []), device]);
+            }
+        });
+    });
+
+    const byPath = new Map();
+    pathCandidates.forEach((devices, path) => {
+        // If multiple devices can have the same path, pick the ancestor device
+        byPath.set(path, devices.find(device => (
+            !getClosure(ancestors, getParents, device).some(ancestor => devices.includes(ancestor))
+        )));
+    });
+
+    return {
+        getAncestors: device => getClosure(ancestors, getParents, device),
+        getDescendants: device => getClosure(descendants, getChildren, device),
+        getDiskMembers: disk => {
+            if (!diskMembers.has(disk)) {
+                diskMembers.set(disk, new Set([disk, ...getClosure(descendants, getChildren, disk)]));
+            }
+
+            return diskMembers.get(disk);
+        },
+        index: { byName, byPath },
+    };
+};
+
+/* Get the indexed graph of the given device data
+ * - the graph is built once per device data object, the closures are computed on first use
+ * @param {Object} deviceData - The device data object
+ * @returns {Object} Lookups for the device ancestors, descendants and disk members,
+ *                   and the `index` of the devices by their name and path
+ */
+export const getDeviceGraph = (deviceData) => {
+    if (!deviceGraphs.has(deviceData)) {
+        deviceGraphs.set(deviceData, createDeviceGraph(deviceData));
+    }
+
+    return deviceGraphs.get(deviceData);
+};
+
+/* Index the devices of a device tree snapshot by their name, path and /dev/disk/by-* links
+ * @param {Object} deviceData - The device data object
+ * @returns {Object} The `byName` and `byPath` maps of device IDs
+ */
+const indexDevices = (deviceData) => {
+    return getDeviceGraph(deviceData).index;
+};
+
 /* Get the list of IDs of all the ancestors of the given device
  * (excluding the device itself)
  * @param {Object} deviceData - The device data object
@@ -31,15 +120,7 @@ export const requestsToDbus = (requests) => {
  * @returns {Array}
  */
 export const getDeviceAncestors = (deviceData, device) => {
-    const ancestors = [];
-    const deviceParents = deviceData[device]?.parents?.v || [];
-
-    deviceParents.forEach(parent => {
-        ancestors.push(parent);
-        ancestors.push(...getDeviceAncestors(deviceData, parent));
-    });
-
-    return ancestors;
+    return getDeviceGraph(deviceData).getAncestors(device);
 };
 
 /* Get the list of IDs of all the descendants of the given device
@@ -49,11 +130,7 @@ export const getDeviceAncestors = (deviceData, device) => {
  * @returns {Array}
  */
 export const getDeviceChildren = ({ device, deviceData }) => {
-    const deviceChildren = deviceData[device]?.children?.v || [];
-
-    return deviceChildren.reduce((acc, child) => {
-        return [...acc, child, ...getDeviceChildren({ device: child, deviceData })];
-    }, []);
+    return getDeviceGraph(deviceData).getDescendants(device);
 };
 
 /* Get the list of IDs of all LUKS devices
@@ -62,20 +139,46 @@ export const getDeviceChildren = ({ device, deviceData }) => {
  * @returns {Array}
  */
 export const getLockedLUKSDevices = (selectedDisks, deviceData) => {
+    const graph = getDeviceGraph(deviceData);
     // check for selected disks and their children devices for locked LUKS devices
-    const relevantDevs = selectedDisks.flatMap(disk => (
-        [disk, ...getDeviceChildren({ device: disk, deviceData })]
-    ));
+    const relevantDevs = new Set(selectedDisks.flatMap(disk => [...graph.getDiskMembers(disk)]));
 
     return Object.keys(deviceData).filter(d => {
         return (
-            relevantDevs.includes(d) &&
+            relevantDevs.has(d) &&
             deviceData[d].formatData.type.v === "luks" &&
             deviceData[d].formatData.attrs.v.has_key !== "True"
         );
     });
 };
 
+/* Get the free or the total space of every disk from the device data
+ * @param {Object} deviceData - The device data object
+ * @param {string} field - Either "free" or "total"
+ * @returns {Object} The space in bytes keyed by the disk ID
+ */
+export const getDiskSpace = (deviceData, field) => {
+    return Object.fromEntries(
+        Object.keys(deviceData)
+                .filter(device => deviceData[device]["is-disk"]?.v)
+                .map(disk => [disk, Number(deviceData[disk][field]?.v) || 0])
+    );
+};
+
+/* Sum the space of the given disks
+ * - the backend reports the space of a set of disks as the sum of the space of each disk
+ * @param {Object} diskSpace - The space of every disk, as returned by getDiskSpace
+ * @param {Array} diskNames - The list of disk IDs
+ * @returns {number|undefined} The space in bytes, undefined if some disk is not in the device data
+ */
+export const getDiskSetSpace = (diskSpace, diskNames) => {
+    if (diskNames.some(disk => diskSpace[disk] === undefined)) {
+        return undefined;
+    }
+
+    return diskNames.reduce((acc, disk) => acc + diskSpace[disk], 0);
+};
+
 /* Check if the requests array contains duplicate entries
  * @param {Array} requests - The list of requests from a partitioning
  * @param {string} fieldName - The ID of the field to check for duplicates, ex: "mount-point"
@@ -105,13 +208,11 @@ export const isDuplicateRequestField = (requests, fieldName, fieldValue) => {
 };
 
 export const getDeviceByPath = (deviceData, path) => {
-    const devices = Object.keys(deviceData).filter(d => deviceData[d].path?.v === path || deviceData[d].links?.v.includes(path));
-    // If multiple devices can have the same path, pick the ancestor device
-    return devices.find(device => !getDeviceAncestors(deviceData, device).some(ancestor => devices.includes(ancestor)));
+    return indexDevices(deviceData).byPath.get(path);
 };
 
 export const getDeviceByName = (deviceData, name) => {
-    return Object.keys(deviceData).find(d => deviceData[d].name?.v === name);
+    return indexDevices(deviceData).byName.get(name);
 };
 
 /* Check if a device has a LUKS encrypted parent
@@ -0,0 +1,118 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+import cockpit from "cockpit";
+
+/* Prefix of the performance entries recorded by the Web UI */
+const PREFIX = "anaconda-webui:";
+const TIMELINE_FILE = "/tmp/anaconda-webui-timeline.json";
+
+/* Frequent events, like DBus calls and dispatched actions, are recorded only during
+ * the startup and at most this many times, the entries are never cleared
+ */
+const MAX_EVENTS = 2000;
+let eventCount = 0;
+let isStartupOver = false;
+
+const shouldRecordEvent = () => {
+    if (isStartupOver || eventCount >= MAX_EVENTS) {
+        return false;
+    }
+
+    eventCount++;
+    return true;
+};
+
+/* Record a point in time on the performance timeline
+ * @param {string} name - The name of the mark
+ */
+export const mark = (name) => {
+    performance.mark(PREFIX + name);
+};
+
+/* Record a mark only the first time it is reached
+ * @param {string} name - The name of the mark
+ * @returns {boolean} True if the mark was recorded now
+ */
+export const markOnce = (name) => {
+    if (performance.getEntriesByName(PREFIX + name, "mark").length !== 0) {
+        return false;
+    }
+
+    mark(name);
+    return true;
+};
+
+/* Record a span between two marks, or from the given mark until now
+ * @param {string} name - The name of the span
+ * @param {string} startMark - The name of the mark starting the span
+ * @param {string} endMark - Optional name of the mark ending the span
+ */
+export const measure = (name, startMark, endMark) => {
+    performance.measure(PREFIX + name, PREFIX + startMark, endMark && PREFIX + endMark);
+};
+
+/* Record a span around a call, the span ends when the returned promise settles
+ * @param {string} name - The name of the span
+ * @param {Function} fn - The function to call
+ * @returns {Promise} The result of the call
+ */
+export const timeSpan = (name, fn) => {
+    const start = performance.now();
+    const end = () => performance.measure(PREFIX + name, { end: performance.now(), start });
+
+    return Promise.resolve()
+            .then(fn)
+            .finally(end);
+};
+
+/* Record a frequent event as a mark, only during the startup
+ * @param {string} name - The name of the mark
+ */
+export const markEvent = (name) => {
+    if (shouldRecordEvent()) {
+        mark(name);
+    }
+};
+
+/* Record a span around a frequent call, only during the startup
+ * @param {string} name - The name of the span
+ * @param {Function} fn - The function to call
+ * @returns {Promise} The result of the call
+ */
+export const timeEvent = (name, fn) => {
+    return shouldRecordEvent() ? timeSpan(name, fn) : Promise.resolve().then(fn);
+};
+
+/* Stop recording the frequent events, the startup is over */
+export const endStartup = () => {
+    isStartupOver = true;
+};
+
+/* Get the recorded marks and spans ordered by their start time
+ * @returns {Array} Objects with the entry `name`, `type`, `start` and `duration` in milliseconds
+ */
+export const getTimeline = () => {
+    return performance.getEntries()
+            .filter(entry => entry.name.startsWith(PREFIX))
+            .map(entry => ({
+                duration: entry.duration,
+                name: entry.name.slice(PREFIX.length),
+                start: entry.startTime,
+                type: entry.entryType,
+            }));
+};
+
+/* Write the recorded timeline as JSON next to the other installer logs
+ * @returns {Promise} Resolves the path of the written file
+ */
+export const exportTimeline = () => {
+    const file = cockpit.file(TIMELINE_FILE, { superuser: "try" });
+    const content = JSON.stringify({ timeOrigin: performance.timeOrigin, timeline: getTimeline() }, null, 2);
+
+    return file.replace(content)
+            .then(() => TIMELINE_FILE)
+            .finally(file.close);
+};
@@ -18,3 +18,26 @@ export const checkIfArraysAreEqual = (array1, array2) => {
         array1Sorted.every((value, index) => value === array2Sorted[index])
     );
 };
+
+/* Map the given items through an async function with a bounded number of calls in flight
+ * - results keep the order of the input items
+ * @param {Array} items
+ * @param {number} limit - Maximal number of concurrently pending calls
+ * @param {Function} fn - Async function called with (item, index)
+ * @returns {Promise<Array>} Resolves the list of results
+ */
+export const mapWithConcurrency = async (items, limit, fn) => {
+    const results = new Array(items.length);
+    let next = 0;
+
+    const worker = async () => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await fn(items[index], index);
+        }
+    };
+
+    await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+
+    return results;
+};
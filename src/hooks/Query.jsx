@@ -0,0 +1,96 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+import { debounce } from "throttle-debounce";
+
+import { useEffect, useMemo, useRef, useState } from "react";
+
+import { error } from "../helpers/log.js";
+
+/* Delay in milliseconds for which the query waits for its inputs to settle */
+const QUERY_DELAY = 150;
+
+/* Create a cache for the results of a query
+ * - the results are kept per scope object (for example a device tree snapshot),
+ *   so they are dropped together with the scope they were computed for
+ * @returns {WeakMap}
+ */
+export const createQueryCache = () => new WeakMap();
+
+/* Get the cache of the results for the given scope
+ * @returns {Map|undefined} The results keyed by the query key, undefined if there is no scope
+ */
+const getScopeCache = (cache, scope) => {
+    if (!cache || !scope) {
+        return undefined;
+    }
+    if (!cache.has(scope)) {
+        cache.set(scope, new Map());
+    }
+
+    return cache.get(scope);
+};
+
+/* Run an asynchronous query whenever its key or scope changes
+ * - the query runs once its inputs did not change for QUERY_DELAY milliseconds
+ * - only the result of the latest request is used, results of superseded requests are ignored
+ * - cached results are used immediately, in-flight requests are shared through the cache
+ * - failed queries are logged, the previous result is kept
+ * @param {WeakMap} cache - Optional cache created with createQueryCache
+ * @param {boolean} enabled - The query does not run while false
+ * @param {string} key - The key identifying the query inputs within the scope
+ * @param {Function} query - Function returning a promise of the result
+ * @param {Object} scope - Object the result is valid for, changes of the scope re-run the query
+ * @returns The result of the latest query, or of the previous one until it resolves
+ */
+export const useAsyncQuery = ({ cache, enabled = true, key, query, scope }) => {
+    const [result, setResult] = useState();
+    const queryRef = useRef(query);
+    queryRef.current = query;
+
+    const debouncedRun = useMemo(() => debounce(QUERY_DELAY, run => run()), []);
+
+    useEffect(() => () => debouncedRun.cancel(), [debouncedRun]);
+
+    useEffect(() => {
+        if (!enabled) {
+            return;
+        }
+
+        let isLatest = true;
+        const scopeCache = getScopeCache(cache, scope);
+        const apply = promise => promise.then(
+            value => {
+                if (isLatest) {
+                    setResult(value);
+                }
+            },
+            exc => error(`Query ${key} failed:`, exc.message || String(exc))
+        );
+
+        if (scopeCache?.has(key)) {
+            apply(scopeCache.get(key));
+        } else {
+            debouncedRun(() => {
+                if (!isLatest) {
+                    return;
+                }
+
+                const promise = queryRef.current();
+                if (scopeCache) {
+                    scopeCache.set(key, promise);
+                    // Do not keep failures, the next request asks again
+                    promise.catch(() => scopeCache.delete(key));
+                }
+                apply(promise);
+            });
+        }
+
+        return () => {
+            isLatest = false;
+        };
+    }, [cache, debouncedRun, enabled, key, scope]);
+
+    return result;
+};
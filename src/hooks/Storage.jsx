@@ -21,17 +21,23 @@ import {
 } from "../apis/storage_disk_initialization.js";
 import {
     createPartitioning,
+    gatherRequests,
     getDeviceTree,
     partitioningSetEncrypt,
     partitioningSetHomeReuse,
     partitioningSetPassphrase,
     resetPartitioning,
+    setManualPartitioningRequests,
 } from "../apis/storage_partitioning.js";
 
+import { warn } from "../helpers/log.js";
 import {
     getDeviceAncestors,
+    getDiskSetSpace,
     hasReusableFedoraWithWindowsOS,
     intersectSelectedDisksWithUsable,
+    requestsFromDbus,
+    requestsToDbus,
     systemMountPoints,
 } from "../helpers/storage.js";
 
@@ -39,66 +45,91 @@ import { PageContext, StorageContext, StorageDefaultsContext } from "../contexts
 
 import { scenarios } from "../components/storage/scenarios/index.js";
 
-export const useDiskTotalSpace = () => {
-    const [diskTotalSpace, setDiskTotalSpace] = useState();
+import {
+    selectDiskFreeSpace,
+    selectDiskTotalSpace,
+    selectOriginalDevices,
+    selectOriginalExistingSystems,
+    selectSelectedDisks,
+    selectSelectedUsableDisks,
+} from "../selectors/storage-selectors.js";
+import { createQueryCache, useAsyncQuery } from "./Query.jsx";
+
+/* Read a value of the storage state with one of the memoized selectors
+ * @param {Function} selector - The selector taking the storage state
+ * @returns The selected value, its identity changes only when its inputs change
+ */
+export const useStorageSelector = (selector) => {
+    return selector(useContext(StorageContext));
+};
 
-    const devices = useOriginalDevices();
-    const { diskSelection } = useContext(StorageContext);
-    const selectedDisks = diskSelection.selectedDisks;
-    const usableDisks = diskSelection.usableDisks;
+/* Results of the disk space queries, kept per device tree snapshot */
+const diskTotalSpaceCache = createQueryCache();
+const diskFreeSpaceCache = createQueryCache();
+const diskSpaceValidationCache = createQueryCache();
+const freeSpaceForSystemCache = createQueryCache();
 
-    useEffect(() => {
-        const update = async () => {
-            const diskNames = intersectSelectedDisksWithUsable(selectedDisks, usableDisks);
-            const diskTotalSpace = await getDiskTotalSpace({ diskNames });
+/* Key of a query for a set of disks, independent of the order of the selection */
+const getDiskSetKey = disks => JSON.stringify([...disks].sort());
 
-            setDiskTotalSpace(diskTotalSpace);
-        };
-        update();
-    }, [selectedDisks, usableDisks, devices]);
+/* Space of the selected usable disks, summed from the device tree snapshot
+ * - the first sum of every snapshot is compared with the backend, if they differ
+ *   the space is queried from the backend for the rest of the snapshot
+ */
+const useDiskSetSpace = ({ cache, field, query, selectDiskSpace }) => {
+    const devices = useOriginalDevices();
+    const diskSpace = useStorageSelector(selectDiskSpace);
+    const diskNames = useStorageSelector(selectSelectedUsableDisks);
+    const localSpace = useMemo(() => getDiskSetSpace(diskSpace, diskNames), [diskSpace, diskNames]);
+
+    // Validate the first non-empty selection of each snapshot, the space of no disks is trivially 0
+    const isLocalSpaceValid = useAsyncQuery({
+        cache: diskSpaceValidationCache,
+        enabled: localSpace !== undefined && diskNames.length > 0,
+        key: field,
+        query: async () => {
+            const remoteSpace = await query({ diskNames });
+
+            if (remoteSpace !== localSpace) {
+                warn(`Disk ${field} space ${localSpace} summed from the device tree differs from ${remoteSpace} reported by the backend`);
+                return false;
+            }
+            return true;
+        },
+        scope: devices,
+    });
+    const needsRemoteSpace = localSpace === undefined || isLocalSpaceValid === false;
+
+    const remoteSpace = useAsyncQuery({
+        cache,
+        enabled: needsRemoteSpace,
+        key: getDiskSetKey(diskNames),
+        query: () => query({ diskNames }),
+        scope: devices,
+    });
+
+    return needsRemoteSpace ? remoteSpace : localSpace;
+};
 
-    return diskTotalSpace;
+export const useDiskTotalSpace = () => {
+    return useDiskSetSpace({ cache: diskTotalSpaceCache, field: "total", query: getDiskTotalSpace, selectDiskSpace: selectDiskTotalSpace });
 };
 
 export const useDiskFreeSpace = () => {
-    const [diskFreeSpace, setDiskFreeSpace] = useState();
-
-    const devices = useOriginalDevices();
-    const { diskSelection } = useContext(StorageContext);
-    const selectedDisks = diskSelection.selectedDisks;
-    const usableDisks = diskSelection.usableDisks;
-
-    useEffect(() => {
-        const update = async () => {
-            const diskNames = intersectSelectedDisksWithUsable(selectedDisks, usableDisks);
-            const diskFreeSpace = await getDiskFreeSpace({ diskNames });
-
-            setDiskFreeSpace(diskFreeSpace);
-        };
-        update();
-    }, [selectedDisks, usableDisks, devices]);
-
-    return diskFreeSpace;
+    return useDiskSetSpace({ cache: diskFreeSpaceCache, field: "free", query: getDiskFreeSpace, selectDiskSpace: selectDiskFreeSpace });
 };
 
 export const useFreeSpaceForSystem = () => {
-    const [freeSpaceForSystem, setFreeSpaceForSystem] = useState();
-
-    const devices = useOriginalDevices();
-    const { diskSelection } = useContext(StorageContext);
-    const selectedDisks = diskSelection.selectedDisks;
+    const selectedDisks = useStorageSelector(selectSelectedDisks);
     const plannedDeviceTree = useDeviceTree();
 
-    useEffect(() => {
-        const update = async () => {
-            const freeSpaceForSystem = await getFreeSpaceForSystem({ mountPoints: systemMountPoints });
-
-            setFreeSpaceForSystem(freeSpaceForSystem);
-        };
-        update();
-    }, [selectedDisks, devices, plannedDeviceTree]);
-
-    return freeSpaceForSystem;
+    // The free space is computed on the planned device tree, which depends on the selected disks
+    return useAsyncQuery({
+        cache: freeSpaceForSystemCache,
+        key: getDiskSetKey(selectedDisks),
+        query: () => getFreeSpaceForSystem({ mountPoints: systemMountPoints }),
+        scope: plannedDeviceTree,
+    });
 };
 
 export const useUsablePartitions = () => {
@@ -257,6 +288,56 @@ export const usePartitioningReset = () => {
     return !needsReset;
 };
 
+export const usePartitioningReuse = () => {
+    const { setIsFormDisabled } = useContext(PageContext) ?? {};
+    const { partitioning } = useContext(StorageContext);
+    const previousRequestsRef = useRef();
+    const mergedRequestsRef = useRef();
+
+    useEffect(() => {
+        const _updateInitialRequests = async () => {
+            if (previousRequestsRef.current !== undefined) {
+                return;
+            }
+
+            // Store previous requests before creating new partitioning
+            previousRequestsRef.current = partitioning?.requests || [];
+
+            const part = await getNewPartitioning({ method: "MANUAL", storageScenarioId: "mount-point-mapping" });
+            const newRequestsDbus = await gatherRequests({ partitioning: part });
+            const newRequests = requestsFromDbus(newRequestsDbus);
+
+            // Merge old requests into new requests by device-spec
+            const _mergedRequests = newRequests.map(newReq => {
+                if (!newReq["device-spec"]) {
+                    return newReq;
+                }
+                const oldReq = previousRequestsRef.current.find(old => old["device-spec"] === newReq["device-spec"]);
+                return oldReq || newReq;
+            });
+
+            mergedRequestsRef.current = _mergedRequests;
+
+            // Set merged requests on the new partitioning (context will auto-update)
+            await setManualPartitioningRequests({
+                partitioning: part,
+                requests: requestsToDbus(_mergedRequests),
+            });
+        };
+
+        _updateInitialRequests();
+    }, [partitioning?.requests]);
+
+    // Wait for partitioning.requests to be updated with merged requests
+    useEffect(() => {
+        if (!partitioning?.requests || !mergedRequestsRef.current) {
+            return;
+        }
+
+        setIsFormDisabled(false);
+    }, [partitioning?.requests, setIsFormDisabled]);
+};
+
 export const useDeviceTree = () => {
     const [deviceTreePath, setDeviceTreePath] = useState();
     const { appliedPartitioning, deviceTrees } = useContext(StorageContext);
@@ -303,13 +384,9 @@ export const usePlannedMountPoints = () => {
 };
 
 export const useOriginalExistingSystems = () => {
-    const originalDeviceTree = useOriginalDeviceTree();
-
-    return originalDeviceTree ? originalDeviceTree.existingSystems : [];
+    return useStorageSelector(selectOriginalExistingSystems);
 };
 
 export const useOriginalDevices = () => {
-    const originalDeviceTree = useOriginalDeviceTree();
-
-    return originalDeviceTree ? originalDeviceTree.devices : {};
+    return useStorageSelector(selectOriginalDevices);
 };
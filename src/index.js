@@ -10,6 +10,7 @@ import React from "react";
 import { createRoot } from "react-dom/client";
 
 import { convertToCockpitLang } from "./helpers/language.js";
+import { mark } from "./helpers/timeline.js";
 
 import { ApplicationWithErrorBoundary } from "./components/app.jsx";
 
@@ -24,6 +25,8 @@ import "../pkg/lib/patternfly/patternfly-6-cockpit.scss";
  */
 import "../pkg/lib/patternfly/patternfly-6-overrides.scss";
 
+mark("page-load");
+
 document.addEventListener("DOMContentLoaded", function () {
     const root = createRoot(document.getElementById("app"));
     root.render(<ApplicationWithErrorBoundary />);
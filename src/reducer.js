@@ -3,7 +3,9 @@
  * SPDX-License-Identifier: LGPL-2.1-or-later
  */
 
-import { useCallback, useReducer } from "react";
+import { useCallback, useReducer, useRef } from "react";
+
+import { markEvent } from "./helpers/timeline.js";
 
 /* Initial state for the storeage store substate */
 export const storageInitialState = {
@@ -103,11 +105,15 @@ export const initialState = {
 /* Custom hook to use the reducer with async actions */
 export const useReducerWithThunk = (reducer, initialState) => {
     const [state, dispatch] = useReducer(reducer, initialState);
+    // Let async actions read the latest rendered state
+    const stateRef = useRef(state);
+    stateRef.current = state;
 
     function customDispatch (action) {
         if (typeof action === "function") {
-            return action(customDispatch);
+            return action(customDispatch, () => stateRef.current);
         } else {
+            markEvent(`dispatch:${action.type}`);
             dispatch(action);
         }
     }
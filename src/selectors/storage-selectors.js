@@ -0,0 +1,67 @@
+/*
+ * Copyright (C) 2026 Red Hat, Inc.
+ * SPDX-License-Identifier: LGPL-2.1-or-later
+ */
+
+import {
+    getDiskSpace,
+    getLockedLUKSDevices,
+    intersectSelectedDisksWithUsable,
+} from "../helpers/storage.js";
+
+/* Returned instead of missing values, so that the result keeps its identity between renders */
+const EMPTY_ARRAY = Object.freeze([]);
+const EMPTY_OBJECT = Object.freeze({});
+
+/* Create a selector which recomputes its result only when one of its inputs changes identity
+ * @param {Array} inputSelectors - Functions reading the inputs from the storage state
+ * @param {Function} compute - Function computing the result from the inputs
+ * @returns {Function} The selector taking the storage state
+ */
+export const createSelector = (inputSelectors, compute) => {
+    let lastInputs;
+    let lastResult;
+
+    return (state) => {
+        const inputs = inputSelectors.map(select => select(state));
+
+        if (!lastInputs || inputs.some((input, i) => input !== lastInputs[i])) {
+            lastInputs = inputs;
+            lastResult = compute(...inputs);
+        }
+
+        return lastResult;
+    };
+};
+
+export const selectSelectedDisks = state => state.diskSelection.selectedDisks;
+
+export const selectUsableDisks = state => state.diskSelection.usableDisks;
+
+export const selectOriginalDevices = state => state.deviceTrees[""]?.devices || EMPTY_OBJECT;
+
+export const selectOriginalExistingSystems = state => state.deviceTrees[""]?.existingSystems || EMPTY_ARRAY;
+
+/* Selected disks which are still usable, selected disks can name disks removed by a rescan */
+export const selectSelectedUsableDisks = createSelector(
+    [selectSelectedDisks, selectUsableDisks],
+    intersectSelectedDisksWithUsable
+);
+
+/* Locked LUKS devices on the selected disks */
+export const selectLockedLUKSDevices = createSelector(
+    [selectSelectedDisks, selectOriginalDevices],
+    getLockedLUKSDevices
+);
+
+/* Free space in bytes of every disk, keyed by the disk ID */
+export const selectDiskFreeSpace = createSelector(
+    [selectOriginalDevices],
+    devices => getDiskSpace(devices, "free")
+);
+
+/* Total space in bytes of every disk, keyed by the disk ID */
+export const selectDiskTotalSpace = createSelector(
+    [selectOriginalDevices],
+    devices => getDiskSpace(devices, "total")
+);
@@ -15,6 +15,7 @@ sys.path.append(os.path.join(TEST_DIR, "common"))
 sys.path.insert(0, os.path.join(TEST_DIR, "helpers"))
 sys.path.append(os.path.join(os.path.dirname(TEST_DIR), "bots/machine"))
 
+from dbus_client import get_dbus_agent
 from installer import Installer
 from language import Language
 from machine_install import VirtInstallMachine
@@ -110,10 +111,11 @@ class VirtInstallMachineCase(MachineCase):
 
         s.dbus_scan_devices()
 
-        # Set the first disk as the installation target
-        s.dbus_set_selected_disk("vda")
+        with get_dbus_agent(m).batch():
+            # Set the first disk as the installation target
+            s.dbus_set_selected_disk("vda")
 
-        self.resetLanguage()
+            self.resetLanguage()
 
         self.allow_journal_messages('.*cockpit.bridge-WARNING: Could not start ssh-agent.*')
         # Nested Cockpit (e.g. storage/network iframes) and language changes which reload the page can log this; harmless.
@@ -156,19 +158,21 @@ class VirtInstallMachineCase(MachineCase):
         m = self.machine
         b = self.browser
         lang = Language(b, m)
-        if not lang.dbus_get_language_kickstarted():
-            lang.dbus_set_language("en_US.UTF-8")
-            lang.dbus_set_locale("en_US.UTF-8")
-        lang.dbus_set_compositor_layouts(["us"])
-        lang.dbus_reset_xlayouts()
-        lang.dbus_reset_virtual_console_keymap()
+        with get_dbus_agent(m).batch():
+            if not lang.dbus_get_language_kickstarted():
+                lang.dbus_set_language("en_US.UTF-8")
+                lang.dbus_set_locale("en_US.UTF-8")
+            lang.dbus_set_compositor_layouts(["us"])
+            lang.dbus_reset_xlayouts()
+            lang.dbus_reset_virtual_console_keymap()
 
     def resetUsers(self):
         m = self.machine
         b = self.browser
         users = Users(b, m)
-        users.dbus_clear_users()
-        users.dbus_set_root_locked(True)
+        with get_dbus_agent(m).batch():
+            users.dbus_clear_users()
+            users.dbus_set_root_locked(True)
 
     def resetTimezone(self):
         m = self.machine
@@ -210,14 +214,16 @@ class VirtInstallMachineCase(MachineCase):
         s = Storage(b, m)
 
         self.removeAllDisks()
-        s.dbus_reset_scenario()
-        # Create an AUTOMATIC partitioning because MANUAL partitioning tests might take the last created
-        if len(s.dbus_get_created_partitioning()) != 0:
-            s.dbus_create_partitioning("AUTOMATIC")
-        s.dbus_reset_selected_disks()
-        # CLEAR_PARTITIONS_DEFAULT = -1
-        s.dbus_set_initialization_mode(-1)
-        s.dbus_scan_devices()
+        # The requests are sent together, up to the first one whose result is needed
+        with get_dbus_agent(m).batch():
+            s.dbus_reset_scenario()
+            # Create an AUTOMATIC partitioning because MANUAL partitioning tests might take the last created
+            if len(s.dbus_get_created_partitioning()) != 0:
+                s.dbus_create_partitioning("AUTOMATIC")
+            s.dbus_reset_selected_disks()
+            # CLEAR_PARTITIONS_DEFAULT = -1
+            s.dbus_set_initialization_mode(-1)
+            s.dbus_scan_devices()
 
     def resetMisc(self):
         # Restart cockpit-ws/cockpit-bridge to avoid crashes in the next test
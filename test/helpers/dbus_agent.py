@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2026 Red Hat, Inc.
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Agent running the D-Bus requests of the tests on the Anaconda bus.
+
+The agent runs inside the installer VM, it is started once per VM by DBusAgentClient
+in dbus_client.py and keeps its connection to the Anaconda bus open.
+
+It reads batches of requests from stdin, one JSON array per line, and writes one line
+with the JSON array of the replies for every batch. The requests of a batch run in order
+and the batch stops at the first failed request, its reply carries the error.
+
+Requests:
+    {"op": "call", "service", "path", "interface", "method", "signature", "args"}
+    {"op": "get", "service", "path", "interface", "property"}
+    {"op": "set", "service", "path", "interface", "property", "signature", "value"}
+    {"op": "run_task", "service", "path", "timeout"}
+
+Values of the "v" type are sent as [signature, value] pairs.
+"""
+
+import json
+import sys
+
+from gi.repository import Gio, GLib  # pylint: disable=import-error
+
+BUS_ADDRESS_FILE = "/run/anaconda/bus.address"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+TASK_INTERFACE = "org.fedoraproject.Anaconda.Task"
+INTEGER_TYPES = "ynqiuxth"
+
+
+def _iter_tuple_types(variant_type):
+    item_type = variant_type.first()
+    while item_type:
+        yield item_type
+        item_type = item_type.next()
+
+
+def _to_python(variant_type, value):
+    """Convert the JSON value to the Python value of a GLib.Variant of the given type."""
+    if variant_type.is_variant():
+        signature, inner = value
+        return _to_variant(signature, inner)
+
+    if variant_type.is_array():
+        element_type = variant_type.element()
+
+        if element_type.is_dict_entry():
+            key_type = element_type.key()
+            value_type = element_type.value()
+            # JSON object keys are always strings
+            is_integer_key = key_type.dup_string() in INTEGER_TYPES
+            return {
+                _to_python(key_type, int(key) if is_integer_key else key): _to_python(value_type, item)
+                for key, item in value.items()
+            }
+
+        return [_to_python(element_type, item) for item in value]
+
+    if variant_type.is_tuple():
+        return tuple(_to_python(item_type, item) for item_type, item in zip(_iter_tuple_types(variant_type), value))
+
+    return value
+
+
+def _to_variant(signature, value):
+    return GLib.Variant(signature, _to_python(GLib.VariantType.new(signature), value))
+
+
+def _to_json(value):
+    if isinstance(value, bytes):
+        return list(value)
+
+    raise TypeError(f"Can not serialize {type(value).__name__}")
+
+
+def _call(connection, service, path, interface, method, parameters=None):
+    return connection.call_sync(
+        service, path, interface, method, parameters,
+        None, Gio.DBusCallFlags.NONE, -1, None
+    ).unpack()
+
+
+def _run_task(connection, service, path, timeout):
+    """Start the Anaconda task and wait for its Stopped signal.
+
+    The task emits Stopped once it ended, whether it succeeded or failed.
+    Finish raises the error of a failed task.
+    """
+    loop = GLib.MainLoop()
+    state = {"stopped": False, "timed_out": False}
+
+    def on_stopped(*_args):
+        state["stopped"] = True
+        loop.quit()
+
+    def on_timeout():
+        state["timed_out"] = True
+        loop.quit()
+        return GLib.SOURCE_REMOVE
+
+    # Subscribe before starting the task, so that the signal of a quick task is not missed
+    subscription = connection.signal_subscribe(
+        service, TASK_INTERFACE, "Stopped", path, None, Gio.DBusSignalFlags.NONE, on_stopped
+    )
+    timer = GLib.timeout_add_seconds(timeout, on_timeout)
+
+    try:
+        _call(connection, service, path, TASK_INTERFACE, "Start")
+        loop.run()
+    finally:
+        connection.signal_unsubscribe(subscription)
+        if not state["timed_out"]:
+            GLib.source_remove(timer)
+
+    if not state["stopped"]:
+        raise TimeoutError(f"Task {path} did not finish within {timeout} seconds")
+
+    _call(connection, service, path, TASK_INTERFACE, "Finish")
+
+
+def _run_request(connection, request):
+    op = request["op"]
+
+    if op == "run_task":
+        _run_task(connection, request["service"], request["path"], request["timeout"])
+        return None
+
+    if op == "call":
+        interface = request["interface"]
+        method = request["method"]
+        parameters = _to_variant(f"({request.get('signature', '')})", request.get("args", []))
+    elif op == "get":
+        interface = PROPERTIES_INTERFACE
+        method = "Get"
+        parameters = GLib.Variant("(ss)", (request["interface"], request["property"]))
+    elif op == "set":
+        interface = PROPERTIES_INTERFACE
+        method = "Set"
+        parameters = GLib.Variant("(ssv)", (
+            request["interface"],
+            request["property"],
+            _to_variant(request["signature"], request["value"]),
+        ))
+    else:
+        raise ValueError(f"Unknown request {op}")
+
+    reply = _call(connection, request["service"], request["path"], interface, method, parameters)
+
+    if op == "get":
+        return reply[0]
+    if op == "set":
+        return None
+    return list(reply)
+
+
+def main():
+    with open(BUS_ADDRESS_FILE) as f:
+        address = f.read().strip()
+
+    connection = Gio.DBusConnection.new_for_address_sync(
+        address,
+        Gio.DBusConnectionFlags.AUTHENTICATION_CLIENT | Gio.DBusConnectionFlags.MESSAGE_BUS_CONNECTION,
+        None,
+        None
+    )
+
+    for line in sys.stdin:
+        replies = []
+
+        for request in json.loads(line):
+            try:
+                replies.append({"result": _run_request(connection, request)})
+            except (GLib.Error, KeyError, TimeoutError, TypeError, ValueError) as e:
+                replies.append({"error": f"{request.get('method') or request.get('property') or request['op']}: {e}"})
+                break
+
+        sys.stdout.write(json.dumps(replies, default=_to_json) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+# Copyright (C) 2026 Red Hat, Inc.
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+import json
+import os
+import subprocess
+from contextlib import contextmanager
+
+HELPERS_DIR = os.path.dirname(__file__)
+
+AGENT_SOURCE = os.path.join(HELPERS_DIR, "dbus_agent.py")
+AGENT_PATH = "/tmp/anaconda-webui-dbus-agent.py"
+
+
+class DBusReply():
+    """Reply of a request sent through the D-Bus agent."""
+
+    def __init__(self, client):
+        self._client = client
+        self._done = False
+        self._value = None
+        self._error = None
+
+    def _resolve(self, value):
+        self._done = True
+        self._value = value
+
+    def _fail(self, error):
+        self._done = True
+        self._error = error
+
+    def result(self):
+        """Get the result of the request, the pending batch is sent first if needed.
+
+        :raises RuntimeError: if the request failed or was not sent
+        """
+        if not self._done:
+            self._client.flush()
+
+        if self._error:
+            raise self._error
+        if not self._done:
+            raise RuntimeError("The D-Bus request was not sent")
+
+        return self._value
+
+
+class DBusAgentClient():
+    """Client of the D-Bus agent running in the installer VM.
+
+    The agent is started once per machine and talks to the Anaconda bus through a single
+    SSH channel. Requests made in a `batch()` block are sent together in one round trip,
+    once the block ends or once the result of one of them is needed.
+
+    Use `get_dbus_agent(machine)` to get the client shared by all helpers of the machine.
+    """
+
+    def __init__(self, machine):
+        self.machine = machine
+        self._process = None
+        self._batch_depth = 0
+        self._pending = []
+
+    def _start(self):
+        with open(AGENT_SOURCE) as f:
+            self.machine.write(AGENT_PATH, f.read())
+
+        ssh_master = getattr(self.machine, "ssh_master", None)
+        self._process = subprocess.Popen(
+            [
+                "ssh",
+                "-p", str(self.machine.ssh_port),
+                "-i", self.machine.identity_file,
+                *(["-o", f"ControlPath={ssh_master}"] if ssh_master else []),
+                "-o", "StrictHostKeyChecking=no",
+                "-o", "UserKnownHostsFile=/dev/null",
+                "-o", "LogLevel=ERROR",
+                "-l", "root",
+                self.machine.ssh_address,
+                "--",
+                "python3", AGENT_PATH,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def close(self):
+        """Stop the agent, the next request starts it again."""
+        if self._process:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+
+    def flush(self):
+        """Send the pending requests to the agent and resolve their replies.
+
+        :raises RuntimeError: if one of the requests failed, the following requests did not run
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # The agent exits when the VM reboots or its SSH connection closes, start it again
+        if not self._process or self._process.poll() is not None:
+            self._start()
+
+        try:
+            self._process.stdin.write(json.dumps([request for request, _reply in pending]) + "\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except BrokenPipeError:
+            line = ""
+
+        if not line:
+            self.close()
+            error = RuntimeError("The D-Bus agent exited unexpectedly")
+            for _request, reply in pending:
+                reply._fail(error)
+            raise error
+
+        replies = json.loads(line)
+        for index, ((_request, reply), data) in enumerate(zip(pending, replies)):
+            if "error" in data:
+                error = RuntimeError(f"D-Bus request failed: {data['error']}")
+                # The agent did not run the requests following the failed one
+                for _request, skipped in pending[index:]:
+                    skipped._fail(error)
+                raise error
+            reply._resolve(data["result"])
+
+    @contextmanager
+    def batch(self):
+        """Collect the requests made in the block and send them together.
+
+        The requests of a block left with an exception are dropped, they are not sent
+        together with later requests.
+        """
+        self._batch_depth += 1
+        pending, start = self._pending, len(self._pending)
+        try:
+            yield self
+        except BaseException:
+            # After a flush in the block, all the pending requests were made in the block
+            first = start if self._pending is pending else 0
+            for _request, reply in self._pending[first:]:
+                reply._fail(RuntimeError("The D-Bus request was dropped, its batch block failed"))
+            del self._pending[first:]
+            raise
+        finally:
+            self._batch_depth -= 1
+
+        if self._batch_depth == 0:
+            self.flush()
+
+    def _request(self, request):
+        reply = DBusReply(self)
+        self._pending.append((request, reply))
+
+        if self._batch_depth == 0:
+            self.flush()
+
+        return reply
+
+    def call(self, service, path, interface, method, signature="", args=()):
+        """Call a D-Bus method.
+
+        :param signature: signature of the arguments, values of "v" are [signature, value] pairs
+        :returns: DBusReply resolving the list of the output arguments
+        """
+        return self._request({
+            "op": "call",
+            "service": service,
+            "path": path,
+            "interface": interface,
+            "method": method,
+            "signature": signature,
+            "args": list(args),
+        })
+
+    def run_task(self, service, path, timeout=120):
+        """Start an Anaconda task and wait until it stops.
+
+        The agent waits for the Stopped signal of the task instead of polling it,
+        so the reply comes as soon as the task ends.
+
+        :param timeout: seconds to wait for the task
+        :returns: DBusReply resolving None, the request fails if the task failed or timed out
+        """
+        return self._request({
+            "op": "run_task",
+            "service": service,
+            "path": path,
+            "timeout": timeout,
+        })
+
+    def get_property(self, service, path, interface, name):
+        """Get a D-Bus property.
+
+        :returns: DBusReply resolving the value of the property
+        """
+        return self._request({
+            "op": "get",
+            "service": service,
+            "path": path,
+            "interface": interface,
+            "property": name,
+        })
+
+    def set_property(self, service, path, interface, name, signature, value):
+        """Set a D-Bus property.
+
+        :param signature: signature of the value, values of "v" are [signature, value] pairs
+        :returns: DBusReply resolving None
+        """
+        return self._request({
+            "op": "set",
+            "service": service,
+            "path": path,
+            "interface": interface,
+            "property": name,
+            "signature": signature,
+            "value": value,
+        })
+
+
+def get_dbus_agent(machine):
+    """Get the D-Bus agent client shared by all helpers of the machine."""
+    if getattr(machine, "dbus_agent", None) is None:
+        machine.dbus_agent = DBusAgentClient(machine)
+
+    return machine.dbus_agent
@@ -1,12 +1,14 @@
 # Copyright (C) 2021 Red Hat, Inc.
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
+import json
 import os
 import sys
 
 HELPERS_DIR = os.path.dirname(__file__)
 sys.path.append(HELPERS_DIR)
 
+from dbus_client import get_dbus_agent
 from step_logger import log_step
 from steps import LANGUAGE
 from testlib import wait
@@ -55,6 +57,17 @@ class Locale():
         else:
             self.browser.wait_not_present(f"#{self._step}-language-option-{common_prefix}-{locale}")
 
+    @log_step()
+    def check_locale_options_order(self, locales, is_common=True):
+        """Wait until the options of the locales are shown in the given order."""
+        common_prefix = "common" if is_common else "alpha"
+        ids = [f"{self._step}-language-option-{common_prefix}-{locale}" for locale in locales]
+        self.browser.wait_js_cond(
+            f"(ids => ids.map(id => document.getElementById(id)).every((option, i, options) => option && "
+            f"(i === 0 || options[i - 1].compareDocumentPosition(option) & Node.DOCUMENT_POSITION_FOLLOWING)))"
+            f"({json.dumps(ids)})"
+        )
+
     @log_step(snapshot_before=True)
     def check_selected_locale(self, locale, is_common=True):
         common_prefix = "common" if is_common else "alpha"
@@ -138,57 +151,41 @@ class Keyboard():
 class LanguageDBus():
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def dbus_set_language(self, value):
-        self.machine.execute(f'dbus-send --print-reply --bus="{self._bus_address}" \
-            --dest={LOCALIZATION_INTERFACE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            org.freedesktop.DBus.Properties.Set \
-            string:"{LOCALIZATION_INTERFACE}" string:"Language" variant:string:"{value}"')
+        self._dbus.set_property(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE, "Language", "s", value
+        )
 
     def dbus_get_language(self):
-        return self.machine.execute(f'dbus-send --print-reply --bus="{self._bus_address}" \
-            --dest={LOCALIZATION_INTERFACE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            org.freedesktop.DBus.Properties.Get \
-            string:"{LOCALIZATION_INTERFACE}" string:"Language"')
+        return self._dbus.get_property(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE, "Language"
+        ).result()
 
     def dbus_set_locale(self, value):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {BOSS_SERVICE} \
-            {BOSS_OBJECT_PATH} \
-            {BOSS_INTERFACE} SetLocale s "{value}"')
+        self._dbus.call(BOSS_SERVICE, BOSS_OBJECT_PATH, BOSS_INTERFACE, "SetLocale", "s", [value])
 
     def dbus_set_compositor_layouts(self, layouts):
-        self.machine.execute(f"busctl --address='{self._bus_address}' \
-            call \
-            {LOCALIZATION_SERVICE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            {LOCALIZATION_INTERFACE} SetCompositorLayouts asas 1 '{layouts[0]}' 0")
+        self._dbus.call(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE,
+            "SetCompositorLayouts", "asas", [layouts[:1], []]
+        )
 
     def dbus_reset_xlayouts(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property \
-            {LOCALIZATION_SERVICE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            {LOCALIZATION_INTERFACE} XLayouts as 0')
+        self._dbus.set_property(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE, "XLayouts", "as", []
+        )
 
     def dbus_reset_virtual_console_keymap(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property \
-            {LOCALIZATION_SERVICE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            {LOCALIZATION_INTERFACE} VirtualConsoleKeymap s ""')
+        self._dbus.set_property(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE, "VirtualConsoleKeymap", "s", ""
+        )
 
     def dbus_get_language_kickstarted(self):
-        out = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property \
-            {LOCALIZATION_SERVICE} \
-            {LOCALIZATION_OBJECT_PATH} \
-            {LOCALIZATION_INTERFACE} LanguageKickstarted')
-        return "true" in out
+        return self._dbus.get_property(
+            LOCALIZATION_SERVICE, LOCALIZATION_OBJECT_PATH, LOCALIZATION_INTERFACE, "LanguageKickstarted"
+        ).result()
 
 
 class Language(Locale, Keyboard, LanguageDBus):
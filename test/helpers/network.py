@@ -11,6 +11,8 @@ from testlib import wait
 HELPERS_DIR = os.path.dirname(__file__)
 sys.path.append(HELPERS_DIR)
 
+from dbus_client import get_dbus_agent
+
 NETWORK_SERVICE = "org.fedoraproject.Anaconda.Modules.Network"
 NETWORK_INTERFACE = NETWORK_SERVICE
 NETWORK_OBJECT_PATH = "/org/fedoraproject/Anaconda/Modules/Network"
@@ -27,26 +29,16 @@ COCKPIT_CHECKPOINT_ROLLBACK_TIME = 7
 class NetworkDBus():
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def dbus_get_hostname(self):
-        return self.machine.execute(
-            f'busctl --address="{self._bus_address}" \
-                    get-property  \
-                    {NETWORK_SERVICE} \
-                    {NETWORK_OBJECT_PATH} \
-                    {NETWORK_INTERFACE} Hostname'
-        )
+        return self._dbus.get_property(NETWORK_SERVICE, NETWORK_OBJECT_PATH, NETWORK_INTERFACE, "Hostname").result()
 
     def dbus_set_hostname(self, hostname):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property  \
-            {NETWORK_SERVICE} \
-            {NETWORK_OBJECT_PATH} \
-            {NETWORK_INTERFACE} Hostname s {hostname}')
+        self._dbus.set_property(NETWORK_SERVICE, NETWORK_OBJECT_PATH, NETWORK_INTERFACE, "Hostname", "s", hostname)
 
     def dbus_reset_hostname(self):
-        self.dbus_set_hostname("''")
+        self.dbus_set_hostname("")
 
 
 # Assumes NetworkManager backend
@@ -7,6 +7,7 @@ import sys
 HELPERS_DIR = os.path.dirname(__file__)
 sys.path.append(HELPERS_DIR)
 
+from dbus_client import get_dbus_agent
 from steps import SOFTWARE_SELECTION
 
 PAYLOADS_SERVICE = "org.fedoraproject.Anaconda.Modules.Payloads"
@@ -19,18 +20,13 @@ PAYLOAD_DNF_INTERFACE = "org.fedoraproject.Anaconda.Modules.Payloads.Payload.DNF
 class PayloadDNFDBus():
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def _get_active_payload(self):
         """Get the active payload object path."""
-        ret = self.machine.execute(
-            f'busctl --address="{self._bus_address}" '
-            f'get-property '
-            f'{PAYLOADS_SERVICE} '
-            f'{PAYLOADS_OBJECT_PATH} '
-            f'{PAYLOADS_INTERFACE} ActivePayload'
-        )
-        return ret.split('s ')[1].strip().strip('"')
+        return self._dbus.get_property(
+            PAYLOADS_SERVICE, PAYLOADS_OBJECT_PATH, PAYLOADS_INTERFACE, "ActivePayload"
+        ).result()
 
     def dbus_set_packages_selection(self, environment):
         """Set the packages selection via D-Bus.
@@ -39,18 +35,13 @@ class PayloadDNFDBus():
         """
         payload_path = self._get_active_payload()
 
-        # Build the structure for busctl: a{sv} (dictionary of string to variant)
-        # Format: a{sv} N "key1" s "value1" "key2" as N "value2_1" ...
-        # For empty array, use "as 0"
-        # Structure: a{sv} 2 "environment" s "server-product-environment" "groups" as 0
-        self.machine.execute(
-            f'busctl --address="{self._bus_address}" '
-            f'set-property '
-            f'{PAYLOADS_SERVICE} '
-            f'{payload_path} '
-            f'{PAYLOAD_DNF_INTERFACE} '
-            f'PackagesSelection '
-            f'a{{sv}} 2 "environment" s "{environment}" "groups" as 0'
+        self._dbus.set_property(
+            PAYLOADS_SERVICE,
+            payload_path,
+            PAYLOAD_DNF_INTERFACE,
+            "PackagesSelection",
+            "a{sv}",
+            {"environment": ["s", environment], "groups": ["as", []]}
         )
 
     def dbus_reset_to_default_environment(self, environment="server-product-environment"):
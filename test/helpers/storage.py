@@ -3,7 +3,6 @@
 
 import json
 import os
-import re
 import sys
 import time
 
@@ -14,9 +13,10 @@ sys.path.append(BOTS_DIR)
 
 
 
+from dbus_client import get_dbus_agent
 from step_logger import log_step
 from steps import CUSTOM_MOUNT_POINT, INSTALLATION_METHOD
-from testlib import Error, wait
+from testlib import Error
 
 STORAGE_SERVICE = "org.fedoraproject.Anaconda.Modules.Storage"
 STORAGE_INTERFACE = STORAGE_SERVICE
@@ -383,95 +383,68 @@ class StorageUtils(StorageDestination):
 class StorageDBus():
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def dbus_scan_devices(self):
-        task = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH} \
-            {STORAGE_INTERFACE} ScanDevicesWithTask')
-        task = task.splitlines()[-1].split()[-1]
-
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {STORAGE_SERVICE} \
-            {task} \
-            org.fedoraproject.Anaconda.Task Start')
-
-        wait(lambda: self.dbus_get_task_status(task) == "false", tries=20, delay=6)
-
-    def dbus_get_task_status(self, task):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property \
-            {STORAGE_SERVICE} \
-            {task} \
-            org.fedoraproject.Anaconda.Task IsRunning')
-
-        return ret.split('b ')[1].strip().strip('"')
+        [task] = self._dbus.call(
+            STORAGE_SERVICE, STORAGE_OBJECT_PATH, STORAGE_INTERFACE, "ScanDevicesWithTask"
+        ).result()
+
+        self._dbus.run_task(STORAGE_SERVICE, task, timeout=120).result()
 
     def dbus_get_usable_disks(self):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH}/DiskSelection \
-            {STORAGE_INTERFACE}.DiskSelection GetUsableDisks')
+        [disks] = self._dbus.call(
+            STORAGE_SERVICE,
+            f"{STORAGE_OBJECT_PATH}/DiskSelection",
+            f"{STORAGE_INTERFACE}.DiskSelection",
+            "GetUsableDisks"
+        ).result()
 
-        return re.findall('"([^"]*)"', ret)
+        return disks
 
     def dbus_reset_selected_disks(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH}/DiskSelection \
-            {STORAGE_INTERFACE}.DiskSelection SelectedDisks as 0')
+        self._dbus.set_property(
+            STORAGE_SERVICE,
+            f"{STORAGE_OBJECT_PATH}/DiskSelection",
+            f"{STORAGE_INTERFACE}.DiskSelection",
+            "SelectedDisks", "as", []
+        )
 
     def dbus_set_selected_disk(self, disk):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH}/DiskSelection \
-            {STORAGE_INTERFACE}.DiskSelection SelectedDisks as 1 {disk}')
+        self._dbus.set_property(
+            STORAGE_SERVICE,
+            f"{STORAGE_OBJECT_PATH}/DiskSelection",
+            f"{STORAGE_INTERFACE}.DiskSelection",
+            "SelectedDisks", "as", [disk]
+        )
 
     def dbus_reset_scenario(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH} \
-            {STORAGE_INTERFACE} ResetPartitioning')
+        self._dbus.call(STORAGE_SERVICE, STORAGE_OBJECT_PATH, STORAGE_INTERFACE, "ResetPartitioning")
 
     def dbus_create_partitioning(self, method="MANUAL"):
-        return self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH} \
-            {STORAGE_INTERFACE} CreatePartitioning s {method}')
+        [partitioning] = self._dbus.call(
+            STORAGE_SERVICE, STORAGE_OBJECT_PATH, STORAGE_INTERFACE, "CreatePartitioning", "s", [method]
+        ).result()
 
-    def dbus_get_applied_partitioning(self):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property  \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH} \
-            {STORAGE_INTERFACE} AppliedPartitioning')
+        return partitioning
 
-        return ret.split('s ')[1].strip().strip('"')
+    def dbus_get_applied_partitioning(self):
+        return self._dbus.get_property(
+            STORAGE_SERVICE, STORAGE_OBJECT_PATH, STORAGE_INTERFACE, "AppliedPartitioning"
+        ).result()
 
     def dbus_get_created_partitioning(self):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property  \
-            {STORAGE_SERVICE} \
-            {STORAGE_OBJECT_PATH} \
-            {STORAGE_INTERFACE} CreatedPartitioning')
-
-        data = ret.split(" ")
-        return [i.replace('"', '').replace('\n', '') for i in data[2:]]
+        return self._dbus.get_property(
+            STORAGE_SERVICE, STORAGE_OBJECT_PATH, STORAGE_INTERFACE, "CreatedPartitioning"
+        ).result()
 
     def dbus_set_initialization_mode(self, value):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property \
-            {STORAGE_SERVICE} \
-            {DISK_INITIALIZATION_OBJECT_PATH} \
-            {DISK_INITIALIZATION_INTERFACE} InitializationMode i -- {value}')
+        self._dbus.set_property(
+            STORAGE_SERVICE,
+            DISK_INITIALIZATION_OBJECT_PATH,
+            DISK_INITIALIZATION_INTERFACE,
+            "InitializationMode", "i", value
+        )
 
     def get_btrfs_volume_ids(self, volume_name):
         """Get device ids of all volumes with volume_name found."""
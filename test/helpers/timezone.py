@@ -1,6 +1,8 @@
 # Copyright (C) 2021 Red Hat, Inc.
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
+from dbus_client import get_dbus_agent
+
 DATE_TIME_STEP = "anaconda-screen-date-time"
 
 class DateTime():
@@ -130,35 +132,34 @@ class DateTimeDBus():
 
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def dbus_get_system_datetime(self):
-        out = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            call {self.TIMEZONE_SERVICE} {self.TIMEZONE_OBJECT_PATH} \
-            {self.TIMEZONE_INTERFACE} GetSystemDateTime')
-        return out.split('"')[1]
+        [system_datetime] = self._dbus.call(
+            self.TIMEZONE_SERVICE, self.TIMEZONE_OBJECT_PATH, self.TIMEZONE_INTERFACE, "GetSystemDateTime"
+        ).result()
+
+        return system_datetime
 
     def dbus_get_ntp_enabled(self):
-        return "true" in self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property {self.TIMEZONE_SERVICE} {self.TIMEZONE_OBJECT_PATH} \
-            {self.TIMEZONE_INTERFACE} NTPEnabled')
+        return self._dbus.get_property(
+            self.TIMEZONE_SERVICE, self.TIMEZONE_OBJECT_PATH, self.TIMEZONE_INTERFACE, "NTPEnabled"
+        ).result()
 
     def dbus_set_ntp_enabled(self, value):
-        val_str = "true" if value else "false"
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property {self.TIMEZONE_SERVICE} {self.TIMEZONE_OBJECT_PATH} \
-            {self.TIMEZONE_INTERFACE} NTPEnabled b {val_str}')
+        self._dbus.set_property(
+            self.TIMEZONE_SERVICE, self.TIMEZONE_OBJECT_PATH, self.TIMEZONE_INTERFACE, "NTPEnabled", "b", bool(value)
+        )
 
     def dbus_get_timezone(self):
-        out = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property {self.TIMEZONE_SERVICE} {self.TIMEZONE_OBJECT_PATH} \
-            {self.TIMEZONE_INTERFACE} Timezone')
-        return out.split('"')[1]
+        return self._dbus.get_property(
+            self.TIMEZONE_SERVICE, self.TIMEZONE_OBJECT_PATH, self.TIMEZONE_INTERFACE, "Timezone"
+        ).result()
 
     def dbus_clear_time_sources(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property {self.TIMEZONE_SERVICE} {self.TIMEZONE_OBJECT_PATH} \
-            {self.TIMEZONE_INTERFACE} TimeSources "aa{{sv}}" {0}')
+        self._dbus.set_property(
+            self.TIMEZONE_SERVICE, self.TIMEZONE_OBJECT_PATH, self.TIMEZONE_INTERFACE, "TimeSources", "aa{sv}", []
+        )
 
 class DateAndTime(DateTime, Timezone, TimeFormat, DateTimeDBus):
     def __init__(self, browser, machine):
@@ -9,6 +9,7 @@ from testlib import Error  # pylint: disable=import-error
 HELPERS_DIR = os.path.dirname(__file__)
 sys.path.append(HELPERS_DIR)
 
+from dbus_client import get_dbus_agent
 from password import Password
 from step_logger import log_step
 from steps import ACCOUNTS
@@ -43,48 +44,28 @@ def override_user_interface_conf_keys(test, **kwargs):
 class UsersDBus():
     def __init__(self, machine):
         self.machine = machine
-        self._bus_address = self.machine.execute("cat /run/anaconda/bus.address")
+        self._dbus = get_dbus_agent(machine)
 
     def dbus_get_users(self):
-        return self.machine.execute(
-            f'busctl --address="{self._bus_address}" \
-            get-property  \
-            {USERS_SERVICE} \
-            {USERS_OBJECT_PATH} \
-            {USERS_INTERFACE} Users'
-        )
+        return self._dbus.get_property(USERS_SERVICE, USERS_OBJECT_PATH, USERS_INTERFACE, "Users").result()
 
     def dbus_clear_users(self):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property  \
-            {USERS_SERVICE} \
-            {USERS_OBJECT_PATH} \
-            {USERS_INTERFACE} Users aa{{sv}} 0')
+        self._dbus.set_property(USERS_SERVICE, USERS_OBJECT_PATH, USERS_INTERFACE, "Users", "aa{sv}", [])
 
     def dbus_get_root_locked(self):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property  \
-            {USERS_SERVICE} \
-            {USERS_OBJECT_PATH} \
-            {USERS_INTERFACE} IsRootAccountLocked')
-
-        return ret.split()[1].strip() == "true"
+        return self._dbus.get_property(
+            USERS_SERVICE, USERS_OBJECT_PATH, USERS_INTERFACE, "IsRootAccountLocked"
+        ).result()
 
     def dbus_set_root_locked(self, locked):
-        self.machine.execute(f'busctl --address="{self._bus_address}" \
-            set-property  \
-            {USERS_SERVICE} \
-            {USERS_OBJECT_PATH} \
-            {USERS_INTERFACE} IsRootAccountLocked b {"true" if locked else "false"}')
+        self._dbus.set_property(
+            USERS_SERVICE, USERS_OBJECT_PATH, USERS_INTERFACE, "IsRootAccountLocked", "b", bool(locked)
+        )
 
     def dbus_get_is_root_password_set(self):
-        ret = self.machine.execute(f'busctl --address="{self._bus_address}" \
-            get-property  \
-            {USERS_SERVICE} \
-            {USERS_OBJECT_PATH} \
-            {USERS_INTERFACE} IsRootPasswordSet')
-
-        return ret.split()[1].strip() == "true"
+        return self._dbus.get_property(
+            USERS_SERVICE, USERS_OBJECT_PATH, USERS_INTERFACE, "IsRootPasswordSet"
+        ).result()
 
 
 class Users(UsersDBus):
@@ -3,13 +3,17 @@
 # Copyright (C) 2022 Red Hat, Inc.
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
+import fcntl
+import gzip
+import hashlib
+import json
 import os
 import shlex
 import socket
 import subprocess
 import sys
 import time
-from tempfile import TemporaryDirectory
+from tempfile import NamedTemporaryFile
 
 WEBUI_TEST_DIR = os.path.dirname(__file__)
 ROOT_DIR = os.path.dirname(WEBUI_TEST_DIR)
@@ -31,10 +35,164 @@ from machine.testvm import (
 # suite expects it to not exist
 os.environ["TEST_ALLOW_NOLOGIN"] = "true"
 
+VM_POOL_DIR = os.path.join(ROOT_DIR, "tmp", "vm-pool")
+# Every key gets a range of ports for this many slots, so the ports of the keys do not overlap
+VM_POOL_MAX_SIZE = 10
+VM_POOL_PORTS_PER_SLOT = 3
+UPDATES_CACHE_DIR = os.path.join(ROOT_DIR, "tmp", "updates-cache")
+# Cached images unused for this many seconds are removed, their kickstart refers to the
+# install HTTP port of a past run
+UPDATES_CACHE_MAX_AGE = 24 * 60 * 60
+
+INTERACTIVE_DEFAULTS_DIR = "usr/share/anaconda"
+INTERACTIVE_DEFAULTS_KS = f"{INTERACTIVE_DEFAULTS_DIR}/interactive-defaults.ks"
+
+
+def newc_entry(name, mode, data=b"", ino=1):
+    """Build one entry of a cpio archive in the 'newc' format, as written by 'cpio -c -o'."""
+    name_bytes = name.encode() + b"\0"
+    is_dir = mode & 0o040000
+    fields = (ino, mode, 0, 0, 2 if is_dir else 1, 0, len(data), 0, 0, 0, 0, len(name_bytes), 0)
+    entry = b"070701" + "".join(f"{value:08x}" for value in fields).encode() + name_bytes
+    entry += b"\0" * (-len(entry) % 4)
+
+    return entry + data + b"\0" * (-len(data) % 4)
+
+
+def newc_entries(data):
+    """Iterate the (name, start, end) of the entries of a 'newc' cpio archive, up to its trailer."""
+    pos = 0
+    while data[pos:pos + 6] == b"070701":
+        file_size = int(data[pos + 54:pos + 62], 16)
+        name_size = int(data[pos + 94:pos + 102], 16)
+        name = data[pos + 110:pos + 110 + name_size - 1].decode(errors="replace")
+        end = pos + 110 + name_size
+        end += -end % 4
+        end += file_size + -(end + file_size) % 4
+
+        if name == "TRAILER!!!":
+            return
+        yield os.path.normpath(name), pos, end
+        pos = end
+
+
+def build_interactive_defaults_image(updates_image, content, output):
+    """Write the updates.img extended with the interactive-defaults.ks to ``output``."""
+    parts = INTERACTIVE_DEFAULTS_DIR.split("/")
+    dirs = ["/".join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+    members = b"".join(newc_entry(name, 0o040755, ino=ino) for ino, name in enumerate(dirs, start=1))
+    members += newc_entry(INTERACTIVE_DEFAULTS_KS, 0o100644, content, ino=len(dirs) + 1)
+
+    with open(updates_image, "rb") as f:
+        base_image = f.read()
+    base_archive = gzip.decompress(base_image)
+    base_entries = list(newc_entries(base_archive))
+
+    if all(name != INTERACTIVE_DEFAULTS_KS for name, _start, _end in base_entries):
+        # Put the kickstart in front of the base image as a separate gzip member without the
+        # cpio trailer, both members decompress into one cpio archive and the base image does
+        # not have to be compressed again
+        output.write(gzip.compress(members, mtime=0))
+        output.write(base_image)
+    else:
+        # Files later in the archive win, the kickstart replaces the one of the base image
+        kept = b"".join(base_archive[start:end] for name, start, end in base_entries if name != INTERACTIVE_DEFAULTS_KS)
+        output.write(gzip.compress(kept + members + newc_entry("TRAILER!!!", 0, ino=0), mtime=0))
+
+
+def prune_updates_cache():
+    """Remove the cached updates images, and temporary files of killed builds, unused for a day."""
+    now = time.time()
+    with os.scandir(UPDATES_CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False) and now - entry.stat().st_mtime > UPDATES_CACHE_MAX_AGE:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                # Pruned by a concurrent test process
+                pass
+
+
+_file_digests: dict[tuple, str] = {}
+
+
+def file_digest(path):
+    """SHA-256 of the file, computed once per file version."""
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _file_digests:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        _file_digests[key] = sha.hexdigest()
+
+    return _file_digests[key]
+
+
+class VMPoolSlot:
+    """Slot of the VM pool, holding the saved memory state of a booted installer VM.
+
+    The slots of one image/firmware/payload combination share a key, every slot is used
+    by one test process at a time. The first user of a slot boots the installer and saves
+    its memory state once the web view started, the next users restore the saved state.
+    """
+
+    def __init__(self, key, index):
+        self.label = f"anaconda-pool-{key}-{index}"
+        self.dir = os.path.join(VM_POOL_DIR, self.label)
+        self.state_file = os.path.join(self.dir, "state.save")
+        self.config_file = os.path.join(self.dir, "config.json")
+        # Each slot forwards its own ports and has its own install HTTP server,
+        # the saved VM can not change them
+        key_base = 20000 + int(key[:4], 16) % 1000 * VM_POOL_MAX_SIZE * VM_POOL_PORTS_PER_SLOT
+        self.ssh_port = key_base + index * VM_POOL_PORTS_PER_SLOT
+        self.web_port = self.ssh_port + 1
+        self.http_port = self.ssh_port + 2
+        self._lock = None
+
+    def try_lock(self):
+        os.makedirs(self.dir, exist_ok=True)
+        lock = open(os.path.join(self.dir, "lock"), "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            return False
+
+        self._lock = lock
+        return True
+
+    def release(self):
+        if self._lock:
+            self._lock.close()
+            self._lock = None
+
+    @property
+    def ports(self):
+        return (self.ssh_port, self.web_port, self.http_port)
+
+    def is_ready(self):
+        """Whether the slot holds a saved VM using the ports of the slot."""
+        if not os.path.exists(self.state_file) or not os.path.exists(self.config_file):
+            return False
+
+        config = self.read_config()
+        return all(config.get(name) == getattr(self, name) for name in ("ssh_port", "web_port", "http_port"))
+
+    def read_config(self):
+        with open(self.config_file) as f:
+            return json.load(f)
+
+    def write_config(self, config):
+        with open(self.config_file, "w") as f:
+            json.dump(config, f)
+
 
 class VirtInstallMachine(VirtMachine):
     http_install_server = None
     http_install_port = None
+    vm_pool_slot = None
 
     def __init__(self, image, **kwargs):
         # From test ``provision`` / ``new_machine``; must not reach Machine.__init__.
@@ -60,12 +218,15 @@ class VirtInstallMachine(VirtMachine):
     def _execute(self, cmd):
         return subprocess.check_call(cmd, stderr=subprocess.STDOUT, shell=True)
 
+    def _is_port_free(self, port):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            return sock.connect_ex(('127.0.0.1', port)) != 0
+
     def _get_free_port(self, start_port=8000):
         port = start_port
         while True:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                if sock.connect_ex(('127.0.0.1', port)) != 0:
-                    return port
+            if self._is_port_free(port):
+                return port
             port = port + 1
 
     def _wait_http_server_running(self, port):
@@ -77,14 +238,18 @@ class VirtInstallMachine(VirtMachine):
         with timeout.Timeout(seconds=50, error_message="Timeout while waiting for http server to start"):
             self._execute(WAIT_HTTP_RUNNING)
 
-    def _serve_install_http(self):
+    def _serve_install_http(self, port=None):
         """Serve ``ROOT_DIR`` (updates.img, ``test/kickstarts/``, payload tree under ``tmp/``).
 
         Idempotent: returns the existing port without spawning a second server.
+
+        :param port: port the server must use, the install HTTP port of the VM pool slot
         """
         if self.http_install_server is not None:
             return self.http_install_port
-        port = self._get_free_port()
+        if port is not None and not self._is_port_free(port):
+            raise RuntimeError(f"The install HTTP port {port} is already in use")
+        port = port or self._get_free_port(8000)
         self.http_install_server = subprocess.Popen([
             "python3", "-m", "http.server", "-d", ROOT_DIR, str(port),
         ])
@@ -110,18 +275,113 @@ class VirtInstallMachine(VirtMachine):
         raise ValueError(f"Unsupported payload_type value: {mode!r}")
 
     def _write_interactive_defaults_ks(self, updates_image, updates_image_edited):
-        content = self._payload_source()
-        defaults_path = "usr/share/anaconda/"
-        print("Adding interactive defaults to updates.img")
-        with TemporaryDirectory() as tmp_dir:
-            os.makedirs(f"{tmp_dir}/{defaults_path}")
-            # unpack initrd to the temporary directory
-            os.system(f"cd {tmp_dir} && gzip -dc {updates_image} | cpio -idu")
-            # add new interactive-defaults.ks (have to be available at start of the installer)
-            with open(f"{tmp_dir}/{defaults_path}/interactive-defaults.ks", "wt", encoding="utf-8") as f:
-                f.write(content)
-            # pack the updates.img again and replace the original one
-            os.system(f"cd {tmp_dir} && find . | cpio -c -o | gzip -9cv > {updates_image_edited}")
+        """Link the updates.img extended with interactive-defaults.ks to ``updates_image_edited``.
+
+        The images are cached by the hash of the base image and the kickstart, so every
+        combination is built only once.
+        """
+        content = self._payload_source().encode()
+        digest = hashlib.sha256(f"{file_digest(updates_image)}\0".encode() + content).hexdigest()
+        cached_image = os.path.join(UPDATES_CACHE_DIR, f"{digest}.img")
+
+        os.makedirs(UPDATES_CACHE_DIR, exist_ok=True)
+        prune_updates_cache()
+
+        try:
+            # Mark the image as used, so that it is not pruned
+            os.utime(cached_image)
+        except FileNotFoundError:
+            # interactive-defaults.ks has to be available at start of the installer
+            print("Adding interactive defaults to updates.img")
+            with NamedTemporaryFile(dir=UPDATES_CACHE_DIR, delete=False) as f:
+                try:
+                    build_interactive_defaults_image(updates_image, content, f)
+                except BaseException:
+                    os.remove(f.name)
+                    raise
+            # Concurrent test processes build the same image, the last one wins
+            os.replace(f.name, cached_image)
+
+        if os.path.lexists(updates_image_edited):
+            os.remove(updates_image_edited)
+        os.symlink(cached_image, updates_image_edited)
+
+    def _use_vm_pool(self):
+        """VMs booted with a kickstart or custom boot options are not shared through the pool."""
+        return (
+            os.environ.get("TEST_VM_POOL", "") == "1" and
+            not self.is_live() and
+            not self.kickstart_file_name and
+            not self.pause_at_summary and
+            not self.console_file and
+            not os.environ.get("TEST_EXTRA_BOOT_ARGS")
+        )
+
+    def _acquire_vm_pool_slot(self, updates_image):
+        """Lock a free slot of the VM pool for this image/firmware/payload combination.
+
+        The key also covers the updates.img, so the saved VMs are booted again when it changes.
+
+        :returns: the locked VMPoolSlot, None if all slots are in use
+        """
+        updates_stat = os.stat(updates_image)
+        key = hashlib.sha256(
+            f"{self.image}:{os.environ.get('TEST_COMPOSE', '')}:{self.is_efi}:{self.payload_type}:"
+            f"{self.memory_mb}:{updates_stat.st_size}:{updates_stat.st_mtime_ns}".encode()
+        ).hexdigest()[:12]
+
+        pool_size = int(os.environ.get("TEST_VM_POOL_SIZE", "4"))
+        if not 1 <= pool_size <= VM_POOL_MAX_SIZE:
+            raise ValueError(f"TEST_VM_POOL_SIZE must be between 1 and {VM_POOL_MAX_SIZE}")
+
+        for index in range(pool_size):
+            slot = VMPoolSlot(key, index)
+            if slot.try_lock():
+                # The ports may be taken by a slot of another key or by an unrelated process
+                if all(self._is_port_free(port) for port in slot.ports):
+                    return slot
+                slot.release()
+
+        return None
+
+    def _virsh(self, command):
+        self._execute(f"virsh -q -c qemu:///session {command}")
+
+    def _save_to_vm_pool(self):
+        """Save the memory state of the booted VM to its pool slot and continue from the saved state."""
+        slot = self.vm_pool_slot
+        print(f"Saving the installer VM to the VM pool slot {slot.label}")
+        self._virsh(f"save {self.label} {shlex.quote(slot.state_file)}")
+        slot.write_config({
+            "http_port": slot.http_port,
+            "ssh_address": self.ssh_address,
+            "ssh_port": slot.ssh_port,
+            "web_address": self.web_address,
+            "web_port": slot.web_port,
+        })
+        self._restore_from_vm_pool()
+
+    def _restore_from_vm_pool(self):
+        """Start the VM from the memory state saved in its pool slot."""
+        slot = self.vm_pool_slot
+        config = slot.read_config()
+
+        self.label = slot.label
+        self.ssh_address = config["ssh_address"]
+        self.ssh_port = slot.ssh_port
+        self.web_address = config["web_address"]
+        self.web_port = slot.web_port
+        # The installer fetches the payload from the server the saved VM was configured with
+        self._serve_install_http(slot.http_port)
+
+        # A previous user of the slot may have left its VM running
+        self._execute(f"virsh -q -c qemu:///session destroy {self.label} >/dev/null 2>&1 || true")
+        self._virsh(f"restore {shlex.quote(slot.state_file)}")
+        self._attach_libvirt_domain()
+
+        Machine.wait_boot(self, timeout_sec=60)
+        # The clock of the guest stopped while its memory state was saved
+        Machine.execute(self, f"date -s @{int(time.time())}")
 
     def start(self):
         self.is_efi = os.environ.get("TEST_FIRMWARE", "efi") == "efi"
@@ -131,13 +391,36 @@ class VirtInstallMachine(VirtMachine):
         if not os.path.exists(self.payload_path):
             raise FileNotFoundError(f"Missing payload in {self.payload_path}; use 'make payload'.")
 
-        self._serve_install_http()
-
         update_img_global_file = os.path.join(ROOT_DIR, f"updates-{self.os}.img")
-        update_img_file = os.path.join(ROOT_DIR, f"{self.label}-updates.img")
         if not os.path.exists(update_img_global_file):
             raise FileNotFoundError("Missing updates.img file")
 
+        if self._use_vm_pool():
+            self.vm_pool_slot = self._acquire_vm_pool_slot(update_img_global_file)
+
+        if self.vm_pool_slot:
+            if self.vm_pool_slot.is_ready():
+                try:
+                    self._restore_from_vm_pool()
+                except Exception as e:
+                    self.print_console_log()
+                    self.kill()
+                    raise e
+                return
+
+            # The first user of the slot boots the VM which is saved to the slot
+            self.label = self.vm_pool_slot.label
+            self.ssh_port = self.vm_pool_slot.ssh_port
+            self.web_port = self.vm_pool_slot.web_port
+            self._execute(
+                f"virsh -q -c qemu:///session destroy {self.label} >/dev/null 2>&1; "
+                f"virsh -q -c qemu:///session undefine --nvram {self.label} >/dev/null 2>&1 || true"
+            )
+
+        self._serve_install_http(self.vm_pool_slot.http_port if self.vm_pool_slot else None)
+
+        update_img_file = os.path.join(ROOT_DIR, f"{self.label}-updates.img")
+
         inst_ks_arg = ""
         if not self.is_live():
             # Configure the payload in interactive-defaults.ks
@@ -234,19 +517,38 @@ class VirtInstallMachine(VirtMachine):
 
                 # Symlink /usr/share/cockpit to /usr/local/share/cockpit so that rsync works without killing cockpit-bridge
                 Machine.execute(self, "mkdir -p /usr/local/share/cockpit/anaconda-webui && mount --bind /usr/share/cockpit /usr/local/share/cockpit")
+
+                if self.vm_pool_slot:
+                    self._save_to_vm_pool()
         except Exception as e:
             self.print_console_log()
             self.kill()
             raise e
 
     def _cleanup(self, quick=False):
-        super()._cleanup(quick=quick)
-        # VirtMachine.kill / wait_poweroff destroy the guest but leave persistent XML (virt-install);
-        # undefine so the domain and EFI NVRAM do not accumulate in the session connection.
-        self._execute(
-            f"virsh -q -c qemu:///session undefine --nvram "
-            f"--remove-all-storage {self.label} || true"
-        )
+        # Set by get_dbus_agent() in test/helpers/dbus_client.py
+        if getattr(self, "dbus_agent", None):
+            self.dbus_agent.close()
+
+        if self.vm_pool_slot:
+            # The saved state of the slot refers to the domain and its EFI NVRAM, keep them
+            # and only remove the disks the test attached to the restored VM
+            disks = subprocess.getoutput(f"virsh -q -c qemu:///session domblklist --details {self.label}")
+            super()._cleanup(quick=quick)
+            for line in disks.splitlines():
+                fields = line.split()
+                if len(fields) == 4 and fields[1] == "disk" and os.path.exists(fields[3]):
+                    os.remove(fields[3])
+            self.vm_pool_slot.release()
+            self.vm_pool_slot = None
+        else:
+            super()._cleanup(quick=quick)
+            # VirtMachine.kill / wait_poweroff destroy the guest but leave persistent XML (virt-install);
+            # undefine so the domain and EFI NVRAM do not accumulate in the session connection.
+            self._execute(
+                f"virsh -q -c qemu:///session undefine --nvram "
+                f"--remove-all-storage {self.label} || true"
+            )
         if self.http_install_server:
             self.http_install_server.kill()
             self.http_install_server = None